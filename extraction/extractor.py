@@ -499,9 +499,10 @@ async def main(argv: list[str] | None = None) -> int:
         # Set event callback for verbose mode (streaming agent activity)
         if progress_display:
             # Rich terminal display
-            orchestrator.event_callback = lambda activity, activity_type="info", detail=None: progress_display.log_agent_activity(
-                activity, activity_type, detail
-            )
+            # Only wire agent activity when it will be shown, so the agent client
+            # skips formatting events entirely otherwise
+            if progress_display.verbose:
+                orchestrator.event_callback = progress_display.log_agent_activity
             # Set chunk callback to update chunk details
             orchestrator.chunk_callback = lambda chunk_num, chunk_id, files, size_mb: progress_display.update_chunk(
                 chunk_num=chunk_num,
@@ -189,10 +189,4 @@ class ExtractionAgent:
         Returns:
             List of validation errors
         """
-        all_errors: list[ValidationError] = []
-
-        for entity in entities:
-            errors = self.validator.validate(entity)
-            all_errors.extend(errors)
-
-        return all_errors
+        return self.validator.validate_many(entities)
@@ -163,6 +163,22 @@ class ValidationConfig(BaseModel):
         default=True,
         description="Detect broken references (URNs that don't exist)",
     )
+    non_reference_keys: list[str] = Field(
+        default=["name", "description"],
+        description="Free-text keys never scanned for URN references during graph validation",
+    )
+    parallel_validation: bool = Field(
+        default=False,
+        description=(
+            "Run graph validation checks in a thread pool (pays off on "
+            "free-threaded Python builds)"
+        ),
+    )
+    parallel_validation_threshold: int = Field(
+        default=10000,
+        ge=1,
+        description="Minimum entity count before graph validation runs in parallel",
+    )
 
 
 class LLMConfig(BaseModel):
@@ -328,7 +344,9 @@ class ExtractionConfig(BaseSettings):
             "data_dir": str(self.data_dir.absolute()),  # Include data source!
             "chunking": self.chunking.model_dump(),
             "deduplication": self.deduplication.model_dump(),
-            "validation": self.validation.model_dump(),
+            "validation": self.validation.model_dump(
+                exclude={"parallel_validation", "parallel_validation_threshold"}
+            ),
             "llm": self.llm.model_dump(exclude={"max_retries", "timeout_seconds"}),
         }
 
@@ -4,10 +4,53 @@ All models use Pydantic for validation and serialization.
 """
 
 import re
+from collections.abc import Mapping
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+# Precompiled URN and type-name checks, shared with EntityValidator.
+# URN_STRICT_RE and TYPE_NAME_RE are fast paths: a match means the value is
+# valid, so the per-condition checks (which pick the error message) only run
+# for invalid values.
+# "urn:" followed by at least one more ":" (i.e. at least 3 colon-separated parts)
+URN_STRICT_RE = re.compile(r"urn:[^:]*:")
+# ASCII capitalised word; non-ASCII names fall through to the Unicode-aware checks
+TYPE_NAME_RE = re.compile(r"[A-Z][A-Za-z0-9_]*")
+# Same as str.replace("_", "").isalnum() without the intermediate string: \w is
+# str.isalnum() or "_", and at least one character must not be "_"
+ALNUM_UNDERSCORE_RE = re.compile(r"_*[^\W_]\w*")
+
+
+def count_references(properties: Mapping[str, Any]) -> int:
+    """
+    Count entity references (relationships) in a property mapping.
+
+    A reference is a value that is a dict with an "@id" key, or such a dict
+    inside a list value. Reserved "@" keys are skipped.
+
+    Shared by progress tracking and metrics export so both scan properties
+    with the same single-pass loop.
+
+    Args:
+        properties: Entity properties or JSON-LD entity dict
+
+    Returns:
+        Number of references found
+    """
+    count = 0
+    for key, value in properties.items():
+        if key.startswith("@"):
+            continue
+        if isinstance(value, dict):
+            if "@id" in value:
+                count += 1
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict) and "@id" in item:
+                    count += 1
+    return count
+
 
 class Entity(BaseModel):
     """
@@ -42,11 +85,13 @@ class Entity(BaseModel):
     @classmethod
     def validate_urn_format(cls, v: str) -> str:
         """Validate URN format: urn:type:identifier."""
+        if URN_STRICT_RE.match(v):
+            return v
+
         if not v.startswith("urn:"):
             raise ValueError("URN must start with 'urn:'")
 
-        parts = v.split(":")
-        if len(parts) < 3:
+        if v.count(":") < 2:
             raise ValueError(
                 "URN must have format 'urn:type:identifier' (at least 3 parts)"
             )
@@ -57,13 +102,16 @@ class Entity(BaseModel):
     @classmethod
     def validate_type_name(cls, v: str) -> str:
         """Validate type name is alphanumeric and starts with capital letter."""
+        if TYPE_NAME_RE.fullmatch(v):
+            return v
+
         if not v:
             raise ValueError("Type name cannot be empty")
 
         if not v[0].isupper():
             raise ValueError("Type name must start with capital letter")
 
-        if not v.replace("_", "").isalnum():
+        if not ALNUM_UNDERSCORE_RE.fullmatch(v):
             raise ValueError("Type name must be alphanumeric (or contain underscores)")
 
         return v
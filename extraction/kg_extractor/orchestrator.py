@@ -241,18 +241,37 @@ class ExtractionOrchestrator:
         self._entities_lock = asyncio.Lock()
 
         # Worker state tracking for multi-worker progress display
-        # Note: dict operations (assignment, clear) are atomic in CPython
-        # so no lock needed for simple reads/writes
+        # Published as immutable snapshots: every update builds new dicts and
+        # swaps the reference (atomic in CPython), so the display thread reads
+        # without locks or copies and never sees a half-updated state
         self._worker_states: dict[int, dict[str, Any]] = {}
 
     def get_worker_states(self) -> dict[int, dict[str, Any]]:
         """
         Get current worker states for progress display.
 
+        The returned snapshot is shared and must not be mutated. It is replaced,
+        never modified, when a worker reports, so an unchanged reference means
+        no worker state changed.
+
         Returns:
             Dictionary mapping worker_id to worker state
         """
-        return self._worker_states.copy()
+        return self._worker_states
+
+    def _publish_worker_state(self, worker_id: int, **updates: Any) -> None:
+        """
+        Publish a new worker states snapshot with one worker's state updated.
+
+        Args:
+            worker_id: Worker whose state changed
+            **updates: State fields to set (merged over the worker's current state)
+        """
+        states = self._worker_states
+        self._worker_states = {
+            **states,
+            worker_id: {**states.get(worker_id, {}), **updates},
+        }
 
     def _count_relationships(self, entities: list[Entity]) -> int:
         """
@@ -546,15 +565,18 @@ class ExtractionOrchestrator:
         # Helper function to create worker callback (needs to be outside loop)
         def make_worker_callback(wid, c):
             def worker_callback(message, activity_type=None, detail=None):
-                # Update worker state (dict assignment is atomic in CPython)
-                self._worker_states[wid] = {
-                    "status": "active",
-                    "chunk_id": c.chunk_id,
-                    "activity": message,
-                    "activity_type": activity_type,
-                    "detail": detail,
-                    "files_count": len(c.files),
-                    "size_mb": c.total_size_bytes / (1024 * 1024),
+                # Update worker state (published as a new snapshot)
+                self._worker_states = {
+                    **self._worker_states,
+                    wid: {
+                        "status": "active",
+                        "chunk_id": c.chunk_id,
+                        "activity": message,
+                        "activity_type": activity_type,
+                        "detail": detail,
+                        "files_count": len(c.files),
+                        "size_mb": c.total_size_bytes / (1024 * 1024),
+                    },
                 }
 
                 # Also call global event callback for overall stats
@@ -774,13 +796,12 @@ class ExtractionOrchestrator:
                             result["entities"]
                         )
 
-                        self._worker_states[worker_id]["status"] = "completed"
-                        self._worker_states[worker_id]["entity_count"] = len(
-                            result["entities"]
+                        self._publish_worker_state(
+                            worker_id,
+                            status="completed",
+                            entity_count=len(result["entities"]),
+                            relationship_count=relationship_count,
                         )
-                        self._worker_states[worker_id][
-                            "relationship_count"
-                        ] = relationship_count
 
                     # Report progress with detailed status
                     if self.progress_callback:
@@ -892,7 +913,7 @@ class ExtractionOrchestrator:
                         )
 
             # Clear worker states after all chunks complete
-            self._worker_states.clear()
+            self._worker_states = {}
 
             # Final client pool health check
             from kg_extractor.llm.agent_client import AgentClient
@@ -2,12 +2,16 @@
 
 import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from kg_extractor.models import Entity
 
+# Default JSON-LD context, shared read-only across all graphs
+DEFAULT_CONTEXT = MappingProxyType({"@vocab": "http://schema.org/", "urn": "@id"})
+
 
 class JSONLDContext(BaseModel):
     """
@@ -17,7 +21,7 @@ class JSONLDContext(BaseModel):
     """
 
     context: dict[str, str] = Field(
-        default={"@vocab": "http://schema.org/", "urn": "@id"},
+        default_factory=lambda: dict(DEFAULT_CONTEXT),
         description="Context mappings for JSON-LD",
     )
 
@@ -41,6 +45,9 @@ class JSONLDGraph(BaseModel):
         description="Graph entities",
     )
 
+    # Cached result of `types`, reset whenever add_entity() changes the graph
+    _types_cache: set[str] | None = PrivateAttr(default=None)
+
     model_config = {"populate_by_name": True}
 
     def add_entity(self, entity: Entity) -> None:
@@ -51,6 +58,7 @@ class JSONLDGraph(BaseModel):
             entity: Entity to add
         """
         self.graph.append(entity.to_jsonld())
+        self._types_cache = None
 
     def add_entities(self, entities: list[Entity]) -> None:
         """
@@ -98,6 +106,9 @@ class JSONLDGraph(BaseModel):
         """
         Load graph from file.
 
+        When ijson is installed, "@graph" entries are streamed from the file one
+        at a time instead of reading the whole document into memory first.
+
         Args:
             path: Input file path
 
@@ -108,12 +119,26 @@ class JSONLDGraph(BaseModel):
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If file contains invalid JSON
         """
-        data = json.loads(path.read_text())
-
-        return cls(
-            context=JSONLDContext(context=data.get("@context", {})),
-            graph=data.get("@graph", []),
-        )
+        try:
+            import ijson
+        except ImportError:
+            data = json.loads(path.read_bytes())
+
+            return cls(
+                context=JSONLDContext(context=data.get("@context", {})),
+                graph=data.get("@graph", []),
+            )
+
+        try:
+            with path.open("rb") as f:
+                context = next(ijson.items(f, "@context", use_float=True), {})
+                graph = cls(context=JSONLDContext(context=context))
+                f.seek(0)
+                graph.graph.extend(ijson.items(f, "@graph.item", use_float=True))
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+        return graph
 
     @property
     def entity_count(self) -> int:
@@ -125,7 +150,12 @@ class JSONLDGraph(BaseModel):
         """
         Get all unique entity types in graph.
 
+        Types are cached until the next add_entity()/add_entities() call;
+        edit `graph` through those methods so the cache stays current.
+
         Returns:
-            Set of entity type names
+            Set of entity type names (a fresh copy, safe to modify)
         """
-        return {e.get("@type", "Unknown") for e in self.graph}
+        if self._types_cache is None:
+            self._types_cache = {e.get("@type", "Unknown") for e in self.graph}
+        return set(self._types_cache)
@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-from kg_extractor.models import ExtractionMetrics, Entity
+from kg_extractor.models import Entity, ExtractionMetrics, count_references
 
 
 class MetricsExporter:
@@ -18,6 +18,8 @@ class MetricsExporter:
     - Markdown: Human-readable summary
     """
 
+    __slots__ = ("metrics", "entities", "entities_by_type", "total_relationships")
+
     def __init__(
         self, metrics: ExtractionMetrics, entities: list[Entity] | None = None
     ):
@@ -47,18 +49,7 @@ class MetricsExporter:
                 )
 
                 # Count relationships (properties that reference other entities)
-                entity_dict = entity.to_jsonld()
-                for key, value in entity_dict.items():
-                    if key.startswith("@"):
-                        continue
-                    if isinstance(value, dict) and "@id" in value:
-                        self.total_relationships += 1
-                    elif isinstance(value, list):
-                        self.total_relationships += sum(
-                            1
-                            for item in value
-                            if isinstance(item, dict) and "@id" in item
-                        )
+                self.total_relationships += count_references(entity.to_jsonld())
         else:
             self.entities_by_type = {}
             self.total_relationships = 0
@@ -70,37 +61,35 @@ class MetricsExporter:
         Returns:
             Metrics data as dict
         """
+        m = self.metrics
+        duration = m.duration_seconds
+        entities_extracted = m.entities_extracted
+        entity_count = len(self.entities)
+
         result = {
             "extraction": {
-                "total_chunks": self.metrics.total_chunks,
-                "chunks_processed": self.metrics.chunks_processed,
-                "entities_extracted": self.metrics.entities_extracted,
-                "validation_errors": self.metrics.validation_errors,
-                "duration_seconds": self.metrics.duration_seconds,
+                "total_chunks": m.total_chunks,
+                "chunks_processed": m.chunks_processed,
+                "entities_extracted": entities_extracted,
+                "validation_errors": m.validation_errors,
+                "duration_seconds": duration,
             },
             "performance": {
                 "chunks_per_second": (
-                    self.metrics.chunks_processed / self.metrics.duration_seconds
-                    if self.metrics.duration_seconds > 0
-                    else 0
+                    m.chunks_processed / duration if duration > 0 else 0
                 ),
                 "entities_per_second": (
-                    self.metrics.entities_extracted / self.metrics.duration_seconds
-                    if self.metrics.duration_seconds > 0
-                    else 0
+                    entities_extracted / duration if duration > 0 else 0
                 ),
             },
             "quality": {
                 "validation_pass_rate": (
-                    1.0
-                    - (self.metrics.validation_errors / self.metrics.entities_extracted)
-                    if self.metrics.entities_extracted > 0
+                    1.0 - (m.validation_errors / entities_extracted)
+                    if entities_extracted > 0
                     else 1.0
                 ),
                 "relationships_per_entity": (
-                    self.total_relationships / len(self.entities)
-                    if len(self.entities) > 0
-                    else 0
+                    self.total_relationships / entity_count if entity_count > 0 else 0
                 ),
             },
         }
@@ -122,6 +111,22 @@ class MetricsExporter:
         """
         return json.dumps(self.to_dict(), indent=indent)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Export metrics as UTF-8 encoded JSON (2-space indent).
+
+        Uses orjson when installed, which serializes straight to bytes.
+
+        Returns:
+            JSON bytes
+        """
+        try:
+            import orjson
+        except ImportError:
+            return self.to_json().encode("utf-8")
+
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+
     def to_csv(self) -> str:
         """
         Export metrics as CSV string.
@@ -261,8 +266,10 @@ class MetricsExporter:
             ValueError: If format is unknown
         """
         if format == "json":
-            content = self.to_json()
-        elif format == "csv":
+            path.write_bytes(self.to_json_bytes())
+            return
+
+        if format == "csv":
             content = self.to_csv()
         elif format == "markdown":
             content = self.to_markdown()
@@ -1,10 +1,14 @@
 """Rich-based progress display for extraction."""
 
+import logging
+import os
 import time
+from collections import Counter, deque
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.control import Control
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
@@ -18,9 +22,118 @@ from rich.progress import (
     TextColumn,
     TimeElapsedColumn,
 )
+from rich.segment import Segment
 from rich.table import Table
 from rich.text import Text
 
+from kg_extractor.llm.agent_client import AgentClient
+from kg_extractor.models import count_references
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Live display refresh rate.
+# Setters never redraw directly; Live's refresh thread is the only renderer, so
+# bursts of updates (e.g. when chunks complete) are coalesced into the next frame
+# and a modest rate is enough to keep the display smooth
+REFRESH_PER_SECOND = 8
+
+# Terminal multiplexers and CI logs pay for every frame (tmux/screen re-diff the
+# whole pane, CI captures each redraw), so they get a lower default rate
+SLOW_TERMINAL_REFRESH_PER_SECOND = 4
+
+
+def _default_refresh_rate() -> float:
+    """
+    Pick the Live refresh rate for the current environment.
+
+    KG_PROGRESS_FPS overrides detection when set to a positive number.
+
+    Returns:
+        Refresh rate in frames per second
+    """
+    override = os.environ.get("KG_PROGRESS_FPS")
+    if override:
+        try:
+            rate = float(override)
+        except ValueError:
+            rate = 0.0
+        if rate > 0:
+            return rate
+
+    if (
+        os.environ.get("TMUX")
+        or os.environ.get("CI")
+        or os.environ.get("TERM", "").startswith(("screen", "tmux"))
+    ):
+        return SLOW_TERMINAL_REFRESH_PER_SECOND
+
+    return REFRESH_PER_SECOND
+
+
+# ETA: weight of the newest chunk duration in the moving average, and how many
+# timed chunks are needed before an estimate is shown
+ETA_SMOOTHING = 0.2
+ETA_MIN_SAMPLES = 3
+
+# Worker states used when there is no orchestrator (never mutated)
+NO_WORKER_STATES: dict[int, dict[str, Any]] = {}
+
+# _check_rate_limit_status result when no limit is active, shared across frames
+NOT_RATE_LIMITED = (False, 0.0)
+
+# Panel titles, parsed from markup once at import
+MAIN_TITLE = Text.from_markup("[bold blue]Knowledge Graph Extraction[/bold blue]")
+WORKERS_TITLE = Text.from_markup("[bold magenta]Parallel Execution[/bold magenta]")
+ACTIVITY_TITLE = Text.from_markup("[bold magenta]Agent Activity[/bold magenta]")
+SUCCESS_TITLE = Text.from_markup("[bold green]Success[/bold green]")
+ERROR_TITLE = Text.from_markup("[bold red]Error[/bold red]")
+
+# Agent activity line prefixes by activity type (unknown types fall back to "info")
+ACTIVITY_PREFIXES = {
+    "tool": "🔧 ",
+    "thinking": "💭 ",
+    "result": "✅ ",
+    "info": "ℹ️  ",
+}
+
+
+def _control_sequence(sequence: str) -> Control:
+    """Wrap a raw escape sequence so it can be buffered with Console.control."""
+    control = Control()
+    control.segment = Segment(sequence)
+    return control
+
+
+# DEC private mode 2026 (synchronized output): the terminal holds rendering
+# between begin and end, so a frame is drawn whole instead of tearing.
+# Terminals without support ignore both sequences.
+BEGIN_SYNCHRONIZED_UPDATE = _control_sequence("\x1b[?2026h")
+END_SYNCHRONIZED_UPDATE = _control_sequence("\x1b[?2026l")
+
+
+class SynchronizedLive(Live):
+    """Live display that draws each frame as one synchronized terminal update."""
+
+    def refresh(self) -> None:
+        """Redraw the display between synchronized-update markers."""
+        console = self.console
+        if (
+            not console.is_terminal
+            or console.is_dumb_terminal
+            or console.is_jupyter
+            or console.legacy_windows
+        ):
+            super().refresh()
+            return
+
+        # Inside one console buffer, so begin marker, frame and end marker are
+        # flushed to the terminal in a single write
+        with console:
+            console.control(BEGIN_SYNCHRONIZED_UPDATE)
+            super().refresh()
+            console.control(END_SYNCHRONIZED_UPDATE)
+
 
 class ETAColumn(ProgressColumn):
     """Custom column to display estimated time remaining."""
@@ -50,6 +163,57 @@ class ProgressDisplay:
     - Validation errors
     """
 
+    __slots__ = (
+        "console",
+        "verbose",
+        "total_chunks",
+        "data_dir",
+        "_subtitle",
+        "orchestrator",
+        "num_workers",
+        "refresh_per_second",
+        "progress",
+        "chunk_task",
+        "current_chunk_info",
+        "_ema_duration",
+        "_duration_count",
+        "current_chunk_start",
+        "chunks_completed",
+        "current_file",
+        "agent_activity",
+        "_recent_activity",
+        "_pending_activities",
+        "stats",
+        "live",
+        "_worker_panel",
+        "_worker_panel_states",
+        "_worker_panel_rate_limited",
+        "_activity_panel",
+        "_cached_panel",
+        "_revision",
+        "_rendered_revision",
+        # Persistent display tables, their value cells and last rendered values
+        "_rendered_stats",
+        "_rendered_current_file",
+        "_chunk_table",
+        "_chunk_id_cell",
+        "_file_count_cell",
+        "_size_cell",
+        "_current_file_cell",
+        "_files_cell",
+        "_stats_container",
+        "_stats_cells",
+        "_entities_cell",
+        "_relationships_cell",
+        "_average_degree_cell",
+        "_graph_density_cell",
+        "_validation_errors_cell",
+        "_has_validation_errors",
+        "_running_cost_cell",
+        "_input_tokens_cell",
+        "_output_tokens_cell",
+    )
+
     def __init__(
         self,
         total_chunks: int,
@@ -57,6 +221,7 @@ class ProgressDisplay:
         data_dir: Path | None = None,
         orchestrator: Any = None,
         num_workers: int = 1,
+        refresh_per_second: float | None = None,
     ):
         """
         Initialize progress display.
@@ -67,13 +232,22 @@ class ProgressDisplay:
             data_dir: Optional data directory being processed (for display)
             orchestrator: Optional orchestrator reference for worker state tracking
             num_workers: Number of parallel workers (for accurate ETA calculation)
+            refresh_per_second: Live refresh rate; defaults to KG_PROGRESS_FPS or a
+                rate detected from the terminal (lower under tmux/screen and CI)
         """
         self.console = Console()
         self.verbose = verbose
         self.total_chunks = total_chunks
         self.data_dir = data_dir
+        # The data directory and cwd are fixed for the run, so format it once
+        self._subtitle = self._build_subtitle()
         self.orchestrator = orchestrator
         self.num_workers = num_workers
+        self.refresh_per_second = (
+            refresh_per_second
+            if refresh_per_second is not None
+            else _default_refresh_rate()
+        )
 
         # Create progress bars
         self.progress = Progress(
@@ -91,12 +265,16 @@ class ProgressDisplay:
         self.current_chunk_info: dict[str, Any] = {}
 
         # ETA tracking
-        self.chunk_start_times: list[float] = []  # Start time of each chunk
-        self.chunk_durations: list[float] = []  # Duration of completed chunks
+        # Moving average of chunk durations and how many chunks it has seen
+        self._ema_duration: float | None = None
+        self._duration_count: int = 0
         self.current_chunk_start: float | None = None  # Start time of current chunk
         self.chunks_completed: int = 0
         self.current_file: str | None = None  # Currently processing file
-        self.agent_activity: list[str] = []
+        self.agent_activity: deque[str] = deque(maxlen=10)  # Last 10 activities
+        self._recent_activity: deque[str] = deque(maxlen=5)  # Last 5, for display
+        # Raw (activity, type, detail) events awaiting the next refresh
+        self._pending_activities: deque[tuple[str, str, str | None]] = deque(maxlen=10)
         self.stats: dict[str, int | float] = {
             "entities": 0,
             "relationships": 0,
@@ -107,26 +285,122 @@ class ProgressDisplay:
             "running_input_tokens": 0,
             "running_output_tokens": 0,
         }
-        self.all_entities: list[Any] = []  # Track all entities for graph metrics
+
+        # Display tables are built once; _build_display only refreshes cell text
+        self._build_tables()
+
+        # Values last written to the table cells (cells are only rewritten on change)
+        self._rendered_stats: dict[str, int | float] = {}
+        self._rendered_current_file: str | None = None
 
         self.live: Live | None = None
 
+        # Worker panel and the worker/rate-limit state it was built from
+        self._worker_panel: Panel | None = None
+        self._worker_panel_states: dict[int, dict[str, Any]] = NO_WORKER_STATES
+        self._worker_panel_rate_limited = False
+
+        # Agent activity panel, rebuilt only when activity changes
+        self._activity_panel: Panel | None = None
+
+        # Last built panel, reused until a setter bumps the revision. Only setters
+        # write _revision and only the renderer writes _rendered_revision, so the
+        # two threads never write the same attribute
+        self._cached_panel: Panel | None = None
+        self._revision = 0
+        self._rendered_revision = -1
+
+    def _build_tables(self) -> None:
+        """Build the persistent chunk and statistics tables."""
+        # Current chunk info (sequential mode)
+        self._chunk_id_cell = Text("")
+        self._file_count_cell = Text("")
+        self._size_cell = Text("")
+        self._current_file_cell = Text("", style="bold yellow")
+        self._files_cell = Text("", style="dim")
+
+        self._chunk_table = Table.grid(padding=(0, 2))
+        self._chunk_table.add_column(style="bold cyan")
+        self._chunk_table.add_column()
+        self._chunk_table.add_row("Chunk:", self._chunk_id_cell)
+        self._chunk_table.add_row("Files/Chunk:", self._file_count_cell)
+        self._chunk_table.add_row("Size:", self._size_cell)
+
+        # In verbose mode, always reserve space for optional rows (consistent height)
+        if self.verbose:
+            self._chunk_table.add_row("Current File:", self._current_file_cell)
+            self._chunk_table.add_row("Files:", self._files_cell)
+
+        # Statistics - Two column layout
+        # Left column: Entity/Graph stats
+        self._entities_cell = Text("")
+        self._relationships_cell = Text("")
+        self._average_degree_cell = Text("")
+        self._graph_density_cell = Text("")
+        self._validation_errors_cell = Text("", style="green")
+        self._has_validation_errors = False
+
+        left_stats = Table.grid(padding=(0, 2))
+        left_stats.add_column(style="bold green")
+        left_stats.add_column()
+        left_stats.add_row("Entities:", self._entities_cell)
+        left_stats.add_row("Relationships:", self._relationships_cell)
+
+        # Show graph metrics in verbose mode
+        if self.verbose:
+            left_stats.add_row("Average Degree:", self._average_degree_cell)
+            left_stats.add_row("Graph Density:", self._graph_density_cell)
+
+        left_stats.add_row("Validation Errors:", self._validation_errors_cell)
+
+        # Right column: Cost/Token stats
+        self._running_cost_cell = Text("", style="bold yellow")
+        self._input_tokens_cell = Text("")
+        self._output_tokens_cell = Text("")
+
+        right_stats = Table.grid(padding=(0, 2))
+        right_stats.add_column(style="bold cyan")
+        right_stats.add_column()
+        right_stats.add_row("Running Cost:", self._running_cost_cell)
+        right_stats.add_row("Input Tokens:", self._input_tokens_cell)
+        right_stats.add_row("Output Tokens:", self._output_tokens_cell)
+
+        # Combine left and right stats in a container
+        self._stats_container = Table.grid(padding=(0, 4))
+        self._stats_container.add_column()  # Left column
+        self._stats_container.add_column()  # Right column
+        self._stats_container.add_row(left_stats, right_stats)
+
+        # Stats key -> cell it is shown in and how the value is formatted
+        self._stats_cells: list[tuple[str, Text, Callable[[Any], str]]] = [
+            ("entities", self._entities_cell, str),
+            ("relationships", self._relationships_cell, str),
+            ("validation_errors", self._validation_errors_cell, str),
+            # Always show running cost (even when $0.0000)
+            ("running_cost_usd", self._running_cost_cell, "${:.4f}".format),
+            ("running_input_tokens", self._input_tokens_cell, "{:,}".format),
+            ("running_output_tokens", self._output_tokens_cell, "{:,}".format),
+        ]
+        if self.verbose:
+            self._stats_cells += [
+                ("average_degree", self._average_degree_cell, "{:.2f}".format),
+                ("graph_density", self._graph_density_cell, "{:.4f}".format),
+            ]
+
     def start(self) -> None:
         """Start the live display."""
         # Remove console handlers from root logger to prevent interference with Rich Live
         # This allows initial startup messages to be shown, but stops logging output
         # once the progress display takes over
-        import logging
-
         root_logger = logging.getLogger()
-        # Remove only StreamHandler instances (keep file handlers)
-        handlers_to_remove = [
+        # Remove only StreamHandler instances (keep file handlers). FileHandler
+        # subclasses StreamHandler, so it has to be excluded explicitly
+        for handler in [
             h
             for h in root_logger.handlers
             if isinstance(h, logging.StreamHandler)
             and not isinstance(h, logging.FileHandler)
-        ]
-        for handler in handlers_to_remove:
+        ]:
             root_logger.removeHandler(handler)
 
         self.chunk_task = self.progress.add_task(
@@ -134,20 +408,26 @@ class ProgressDisplay:
         )
 
         # Start live display
-        # Use high refresh rate (20 Hz) to prevent visual artifacts during rapid updates
-        # When chunks complete, multiple updates happen in quick succession which can
-        # cause terminal display corruption with lower refresh rates
-        self.live = Live(
-            self._build_display(),
+        # Live renders this object via __rich__ on its own refresh timer, so setters
+        # only bump the revision; the cached panel is reused until they do
+        self.live = SynchronizedLive(
+            self,
             console=self.console,
-            refresh_per_second=20,
+            refresh_per_second=self.refresh_per_second,
         )
         self.live.start()
 
     def stop(self) -> None:
         """Stop the live display."""
         if self.live:
+            # Live.stop() renders the final frame itself
             self.live.stop()
+            self.live = None
+
+    def flush(self) -> None:
+        """Redraw the live display with the latest state immediately."""
+        if self.live:
+            self.live.refresh()
 
     def update_chunk(
         self,
@@ -165,20 +445,39 @@ class ProgressDisplay:
             files: Files in this chunk
             size_mb: Total size of files in MB
         """
+        # Show first 5 filenames, then "... and N more" if needed
+        file_count = len(files)
+        files_display = ", ".join(f.name for f in files[:5])
+        if file_count > 5:
+            files_display += f" ... and {file_count - 5} more"
+
         self.current_chunk_info = {
             "num": chunk_num,
             "id": chunk_id,
             "files": files,
+            "file_count": file_count,
+            "files_display": files_display,
             "size_mb": size_mb,
         }
+        # Format the fixed chunk cells once per chunk instead of per render
+        self._chunk_id_cell.plain = chunk_id
+        self._file_count_cell.plain = str(file_count)
+        self._size_cell.plain = f"{size_mb:.2f} MB"
+        self._files_cell.plain = files_display
+
         self.current_file = None  # Reset current file for new chunk
-        self.agent_activity = []  # Reset activity for new chunk
+        if self.verbose:
+            # Reset activity for new chunk (only ever populated in verbose mode)
+            self._pending_activities.clear()
+            self.agent_activity.clear()
+            self._recent_activity.clear()
+            self._activity_panel = None
 
-        # Track chunk start time for ETA calculation
-        self.current_chunk_start = time.time()
+        # Track chunk start time for ETA calculation (monotonic, so clock
+        # adjustments can't produce negative durations)
+        self.current_chunk_start = time.monotonic()
 
-        if self.live:
-            self.live.update(self._build_display())
+        self._revision += 1
 
     def set_initial_progress(self, chunks_completed: int) -> None:
         """
@@ -195,8 +494,7 @@ class ProgressDisplay:
             self.progress.update(self.chunk_task, completed=chunks_completed)
             self.chunks_completed = chunks_completed
 
-        if self.live:
-            self.live.update(self._build_display())
+        self._revision += 1
 
     def advance_chunk(self) -> None:
         """Advance to next chunk."""
@@ -205,13 +503,16 @@ class ProgressDisplay:
 
         # Record chunk duration for ETA calculation
         if self.current_chunk_start is not None:
-            duration = time.time() - self.current_chunk_start
-            self.chunk_durations.append(duration)
+            duration = time.monotonic() - self.current_chunk_start
+            if self._ema_duration is None:
+                self._ema_duration = duration
+            else:
+                self._ema_duration += ETA_SMOOTHING * (duration - self._ema_duration)
+            self._duration_count += 1
             self.chunks_completed += 1
             self.current_chunk_start = None  # Reset for next chunk
 
-        if self.live:
-            self.live.update(self._build_display())
+        self._revision += 1
 
     def set_current_file(self, file_path: Path | str | None) -> None:
         """
@@ -229,8 +530,7 @@ class ProgressDisplay:
         else:
             self.current_file = None
 
-        if self.live:
-            self.live.update(self._build_display())
+        self._revision += 1
 
     def log_agent_activity(
         self, activity: str, activity_type: str = "info", detail: str | None = None
@@ -252,31 +552,37 @@ class ProgressDisplay:
                     self.set_current_file(file_part)
                 return
 
-            # Keep only last 10 activities
-            if len(self.agent_activity) >= 10:
-                self.agent_activity.pop(0)
-
-            # Format based on type
-            if activity_type == "tool":
-                icon = "🔧"
-            elif activity_type == "thinking":
-                icon = "💭"
-            elif activity_type == "result":
-                icon = "✅"
-            else:
-                icon = "ℹ️ "
-
-            # Build formatted string with optional detail in grey
-            if detail:
-                # Use Rich markup for styling
-                formatted = f"{icon} {activity} [dim]{detail}[/dim]"
-            else:
-                formatted = f"{icon} {activity}"
+            # Formatting is deferred to the next refresh so a burst of events
+            # costs one panel rebuild; only the last 10 can ever be shown
+            self._pending_activities.append((activity, activity_type, detail))
+            self._revision += 1
+
+    def _flush_pending_activities(self) -> None:
+        """Format activities logged since the last refresh into the activity log."""
+        if not self._pending_activities:
+            return
+
+        # popleft is atomic, so events logged while draining are never lost
+        pending = self._pending_activities
+        prefixes = ACTIVITY_PREFIXES
+        default_prefix = prefixes["info"]
+        while pending:
+            activity, activity_type, detail = pending.popleft()
+
+            # Icon prefix comes from the module-level table, not a type branch
+            prefix = prefixes.get(activity_type, default_prefix)
+
+            # Optional detail in grey (Rich markup); one f-string builds the line
+            formatted = (
+                f"{prefix}{activity} [dim]{detail}[/dim]"
+                if detail
+                else f"{prefix}{activity}"
+            )
 
             self.agent_activity.append(formatted)
+            self._recent_activity.append(formatted)
 
-            if self.live:
-                self.live.update(self._build_display())
+        self._activity_panel = None
 
     def update_stats(
         self,
@@ -297,8 +603,7 @@ class ProgressDisplay:
             output_tokens: Output tokens for this chunk (incremental)
         """
         if entities:
-            # Add entities to tracking
-            self.all_entities.extend(entities)
+            # Only running totals are kept; graph metrics need nothing else
             self.stats["entities"] += len(entities)
 
             # Count relationships in the new entities
@@ -313,23 +618,31 @@ class ProgressDisplay:
         self.stats["running_input_tokens"] += input_tokens
         self.stats["running_output_tokens"] += output_tokens
 
-        if self.live:
-            self.live.update(self._build_display())
+        # Counters are picked up by the next Live refresh; no-op updates (e.g. a
+        # chunk with nothing to report) don't force a rebuild
+        if entities or validation_errors or cost_usd or input_tokens or output_tokens:
+            self._revision += 1
 
     def _calculate_eta(self) -> str | None:
         """
         Calculate estimated time remaining based on completed chunks.
 
+        Uses an exponential moving average of chunk durations, so the estimate
+        follows changes in throughput instead of being anchored to early chunks.
         Accounts for parallel execution by dividing remaining work by number of workers.
 
         Returns:
             Formatted ETA string (e.g., "~0:02:30") or None if not enough data
         """
-        if not self.chunk_durations or self.chunks_completed == 0:
+        if (
+            self._ema_duration is None
+            or self._duration_count < ETA_MIN_SAMPLES
+            or self.chunks_completed == 0
+        ):
             return None
 
         # Calculate average chunk duration
-        avg_duration = sum(self.chunk_durations) / len(self.chunk_durations)
+        avg_duration = self._ema_duration
 
         # Calculate remaining chunks
         remaining_chunks = self.total_chunks - self.chunks_completed
@@ -338,10 +651,8 @@ class ProgressDisplay:
             return None
 
         # Estimate remaining time accounting for parallel workers
-        # Calculate number of batches remaining (ceil division)
-        import math
-
-        remaining_batches = math.ceil(remaining_chunks / self.num_workers)
+        # Calculate number of batches remaining (integer ceil division)
+        remaining_batches = -(-remaining_chunks // self.num_workers)
         estimated_seconds = avg_duration * remaining_batches
 
         # Format as HH:MM:SS
@@ -368,28 +679,9 @@ class ProgressDisplay:
         Returns:
             Number of relationships found
         """
-        total_relationships = 0
-
-        for entity in entities:
-            # Get properties dict
-            properties = getattr(entity, "properties", {})
-
-            for key, value in properties.items():
-                # Skip reserved keys
-                if key.startswith("@"):
-                    continue
-
-                # Check if value is an entity reference
-                if isinstance(value, dict) and "@id" in value:
-                    total_relationships += 1
-
-                # Check if value is a list of entity references
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict) and "@id" in item:
-                            total_relationships += 1
-
-        return total_relationships
+        return sum(
+            count_references(getattr(entity, "properties", {})) for entity in entities
+        )
 
     def _update_graph_metrics(self) -> None:
         """Update graph connectivity metrics."""
@@ -397,310 +689,286 @@ class ProgressDisplay:
         r = self.stats["relationships"]
 
         # Average Degree: total edges / total nodes
-        if n > 0:
-            self.stats["average_degree"] = r / n
-        else:
-            self.stats["average_degree"] = 0.0
+        self.stats["average_degree"] = r / n if n else 0.0
 
         # Graph Density: actual edges / possible edges
         # For a directed graph: density = edges / (n * (n-1))
         # For an undirected graph: density = (2 * edges) / (n * (n-1))
         # We'll use directed graph formula
-        if n > 1:
-            possible_edges = n * (n - 1)
-            self.stats["graph_density"] = r / possible_edges
-        else:
-            self.stats["graph_density"] = 0.0
+        self.stats["graph_density"] = r / (n * (n - 1)) if n > 1 else 0.0
 
-    def _check_rate_limit_status(self) -> dict[str, Any]:
+    def _check_rate_limit_status(self) -> tuple[bool, float]:
         """
         Check if globally rate limited.
 
         Returns:
-            Dictionary with {"limited": bool, "remaining": float}
+            Tuple of (limited, seconds remaining until the limit clears)
         """
-        try:
-            from kg_extractor.llm.agent_client import AgentClient
-
-            if AgentClient._rate_limited_until:
-                remaining = AgentClient._rate_limited_until - time.time()
-                if remaining > 0:
-                    return {"limited": True, "remaining": remaining}
-        except Exception:
-            pass
+        # AgentClient stores a wall-clock deadline
+        until = AgentClient._rate_limited_until
+        if until:
+            remaining = until - time.time()
+            if remaining > 0:
+                return True, remaining
 
-        return {"limited": False, "remaining": 0}
+        return NOT_RATE_LIMITED
 
-    def _build_worker_panel(self) -> Panel | None:
+    def _build_worker_panel(
+        self,
+        worker_states: dict[int, dict[str, Any]],
+        rate_limit_status: tuple[bool, float],
+    ) -> Panel | None:
         """
         Build worker panel showing current worker activity.
 
+        Args:
+            worker_states: Worker states fetched from the orchestrator this frame
+            rate_limit_status: Result of _check_rate_limit_status for this frame
+
         Returns:
-            Rich Panel with worker status, or None if no orchestrator
+            Rich Panel with worker status, or None if there is nothing to show
         """
-        if not self.orchestrator:
-            return None
-
-        # Get rate limit status
-        rate_limit_status = self._check_rate_limit_status()
-
-        # Get worker states from orchestrator
-        worker_states = self.orchestrator.get_worker_states()
+        rate_limited, remaining = rate_limit_status
 
-        if not worker_states and not rate_limit_status["limited"]:
+        if not worker_states and not rate_limited:
             # No workers active and not rate limited
             return None
 
         # Build panel content
-        if rate_limit_status["limited"]:
-            # Show rate limit warning
-            remaining = rate_limit_status["remaining"]
-            panel_content = (
+        if rate_limited:
+            # Show rate limit warning, then the waiting workers
+            lines = [
                 f"[bold yellow]⚠ RATE LIMITED[/bold yellow] - "
-                f"All workers paused (resuming in [bold]{remaining:.1f}s[/bold])\n"
+                f"All workers paused (resuming in [bold]{remaining:.1f}s[/bold])"
+            ]
+            lines.extend(
+                f"  [dim]⊗ Worker {wid+1}[/dim]: Waiting for rate limit clearance..."
+                for wid in sorted(worker_states)
             )
 
-            # Show waiting workers
-            for wid in sorted(worker_states.keys()):
-                panel_content += f"  [dim]⊗ Worker {wid+1}[/dim]: Waiting for rate limit clearance...\n"
-
         else:
             # Show normal worker activity
             # Count active vs completed workers
-            active_count = sum(
-                1
-                for state in worker_states.values()
-                if state.get("status", "active") == "active"
-            )
-            completed_count = sum(
-                1
-                for state in worker_states.values()
-                if state.get("status", "active") == "completed"
+            status_counts = Counter(
+                state.get("status", "active") for state in worker_states.values()
             )
+            active_count = status_counts["active"]
+            completed_count = status_counts["completed"]
 
-            # Build header with worker summary
+            # Build header with worker summary, followed by a blank line
             total_workers = len(worker_states)
+            header = f"[bold]Workers:[/bold] {active_count}/{total_workers} active"
             if completed_count > 0:
-                panel_content = (
-                    f"[bold]Workers:[/bold] {active_count}/{total_workers} active, "
-                    f"{completed_count} completed this cycle\n\n"
-                )
-            else:
-                panel_content = (
-                    f"[bold]Workers:[/bold] {active_count}/{total_workers} active\n\n"
-                )
+                header = f"{header}, {completed_count} completed this cycle"
+            lines = [header, ""]
 
-            for wid in sorted(worker_states.keys()):
-                state = worker_states.get(wid, {})
-                status = state.get("status", "active")
+            for wid in sorted(worker_states):
+                state = worker_states[wid]
                 chunk_id = state.get("chunk_id", "?")
                 files_count = state.get("files_count", 0)
                 size_mb = state.get("size_mb", 0)
-                activity = state.get("activity", "Processing...")
-                detail = state.get("detail", "")
+                summary = (
+                    f"Worker {wid+1}: [cyan]{chunk_id}[/cyan] "
+                    f"[dim]({files_count} files, {size_mb:.1f} MB)[/dim]"
+                )
 
                 # Build worker line with status indicator
-                if status == "completed":
-                    # Completed worker - show checkmark
-                    line = f"  [bold green]✓[/bold green] Worker {wid+1}: [cyan]{chunk_id}[/cyan] "
-                    line += f"[dim]({files_count} files, {size_mb:.1f} MB)[/dim]"
-                    line += " → [green]Completed[/green]"
-
-                    # Show entity and relationship counts if available
+                if state.get("status", "active") == "completed":
+                    # Completed worker - show checkmark, plus entity and
+                    # relationship counts if available
                     entity_count = state.get("entity_count", 0)
                     relationship_count = state.get("relationship_count", 0)
-                    if entity_count > 0 or relationship_count > 0:
-                        line += f" [dim]({entity_count} entities, {relationship_count} relationships)[/dim]"
+                    counts = (
+                        f" [dim]({entity_count} entities, "
+                        f"{relationship_count} relationships)[/dim]"
+                        if entity_count > 0 or relationship_count > 0
+                        else ""
+                    )
+                    lines.append(
+                        f"  [bold green]✓[/bold green] {summary}"
+                        f" → [green]Completed[/green]{counts}"
+                    )
                 else:
-                    # Active worker - show green dot
-                    line = f"  [bold green]●[/bold green] Worker {wid+1}: [cyan]{chunk_id}[/cyan] "
-                    line += f"[dim]({files_count} files, {size_mb:.1f} MB)[/dim]"
-
-                    # Add activity
-                    if activity:
-                        # Truncate long activities
-                        if len(activity) > 50:
-                            activity = activity[:47] + "..."
-                        line += f" → {activity}"
+                    # Active worker - show green dot and activity, truncating
+                    # long activities
+                    activity = state.get("activity", "Processing...")
+                    if activity and len(activity) > 50:
+                        activity = activity[:47] + "..."
+                    lines.append(
+                        f"  [bold green]●[/bold green] {summary}"
+                        + (f" → {activity}" if activity else "")
+                    )
 
-                panel_content += line + "\n"
+        panel_content = "\n".join(lines)
 
         return Panel(
-            panel_content.rstrip(),
-            title="[bold magenta]Parallel Execution[/bold magenta]",
+            panel_content,
+            title=WORKERS_TITLE,
             border_style="magenta",
         )
 
-    def _build_display(self) -> Panel:
-        """Build the complete display panel."""
-        # Main progress bar
-        components = [self.progress]
+    def _refresh_chunk_table(self) -> None:
+        """Refresh the current file cell (if changed)."""
+        # Chunk id, file count, size and files cells are written by update_chunk
+        if self._rendered_current_file == self.current_file:
+            return
+        self._rendered_current_file = self.current_file
 
-        # Current chunk info - ONLY for non-parallel mode
-        # In parallel mode, this info doesn't make sense (20 workers = 20 chunks)
-        # The worker panel shows per-worker chunk info instead
-        # Determine if we're in parallel mode by checking for active workers
-        worker_states = (
-            self.orchestrator.get_worker_states() if self.orchestrator else {}
-        )
+        if self.verbose:
+            self._current_file_cell.plain = self.current_file or ""
+
+    def _refresh_stats_table(self) -> None:
+        """Refresh the statistics cells from stats (if changed)."""
+        if self.stats == self._rendered_stats:
+            return
+        rendered = self._rendered_stats
+        self._rendered_stats = self.stats.copy()
+
+        # Only cells whose value changed are re-formatted
+        for key, cell, format_value in self._stats_cells:
+            value = self.stats[key]
+            if key not in rendered or rendered[key] != value:
+                cell.plain = format_value(value)
+
+        # Restyle only when the validation error count crosses zero
+        has_errors = self.stats["validation_errors"] > 0
+        if has_errors != self._has_validation_errors:
+            self._has_validation_errors = has_errors
+            self._validation_errors_cell.style = "red bold" if has_errors else "green"
+
+    def _build_activity_panel(self) -> Panel:
+        """
+        Build the agent activity panel.
 
-        if not worker_states:
-            # Sequential mode - show current chunk info
-            chunk_table = Table.grid(padding=(0, 2))
-            chunk_table.add_column(style="bold cyan")
-            chunk_table.add_column()
-
-            if self.current_chunk_info:
-                files = self.current_chunk_info.get("files", [])
-                file_count = len(files)
-
-                chunk_table.add_row("Chunk:", self.current_chunk_info.get("id", ""))
-                chunk_table.add_row("Files/Chunk:", str(file_count))
-                chunk_table.add_row(
-                    "Size:", f"{self.current_chunk_info.get('size_mb', 0):.2f} MB"
-                )
+        Activities logged since the last refresh are formatted here first. The
+        panel is cached and only rebuilt after agent activity changes.
 
-                # In verbose mode, always reserve space for optional rows (consistent height)
-                if self.verbose:
-                    # Current file row (always present in verbose, may be empty)
-                    current_file_display = (
-                        Text(self.current_file, style="bold yellow")
-                        if self.current_file
-                        else ""
-                    )
-                    chunk_table.add_row("Current File:", current_file_display)
-
-                    # Files list row (always present in verbose, may be empty)
-                    if files:
-                        filenames = [f.name for f in files]
-                        # Show first 5 filenames, then "... and N more" if needed
-                        if len(filenames) <= 5:
-                            files_display = ", ".join(filenames)
-                        else:
-                            files_display = (
-                                ", ".join(filenames[:5])
-                                + f" ... and {len(filenames) - 5} more"
-                            )
-                        chunk_table.add_row("Files:", Text(files_display, style="dim"))
-                    else:
-                        chunk_table.add_row("Files:", "")
+        Returns:
+            Rich Panel with the last 5 activities
+        """
+        self._flush_pending_activities()
+
+        if self._activity_panel is None:
+            if self._recent_activity:
+                activity_text = "\n".join(self._recent_activity)
             else:
-                # Placeholder rows to maintain height even when no chunk info
-                chunk_table.add_row("Chunk:", "")
-                chunk_table.add_row("Files/Chunk:", "")
-                chunk_table.add_row("Size:", "")
-                if self.verbose:
-                    chunk_table.add_row("Current File:", "")
-                    chunk_table.add_row("Files:", "")
+                # Show placeholder to maintain consistent height
+                activity_text = "[dim]Waiting for agent activity...[/dim]"
 
-            components.append(chunk_table)
+            self._activity_panel = Panel(
+                activity_text,
+                title=ACTIVITY_TITLE,
+                border_style="magenta",
+            )
 
-        # Statistics - Two column layout
-        # Left column: Entity/Graph stats
-        left_stats = Table.grid(padding=(0, 2))
-        left_stats.add_column(style="bold green")
-        left_stats.add_column()
+        return self._activity_panel
 
-        left_stats.add_row("Entities:", str(self.stats["entities"]))
-        left_stats.add_row("Relationships:", str(self.stats["relationships"]))
+    def _build_subtitle(self) -> Text | None:
+        """
+        Build the main panel subtitle showing the data directory.
 
-        # Show graph metrics in verbose mode
-        if self.verbose:
-            left_stats.add_row("Average Degree:", f"{self.stats['average_degree']:.2f}")
-            left_stats.add_row(
-                "Graph Density:",
-                (
-                    f"{self.stats['graph_density']:.4f}"
-                    if self.stats["graph_density"] > 0
-                    else "0.0000"
-                ),
-            )
+        Returns:
+            Dimmed data directory (relative to cwd if possible), or None
+        """
+        if not self.data_dir:
+            return None
 
-        left_stats.add_row(
-            "Validation Errors:",
-            (
-                Text(str(self.stats["validation_errors"]), style="red bold")
-                if self.stats["validation_errors"] > 0
-                else Text("0", style="green")
-            ),
-        )
+        # Show relative path if possible, otherwise just the name
+        try:
+            cwd = Path.cwd()
+            try:
+                label = str(self.data_dir.relative_to(cwd))
+            except ValueError:
+                # Not relative to cwd, show name
+                label = self.data_dir.name
+        except Exception:
+            label = str(self.data_dir)
 
-        # Right column: Cost/Token stats
-        right_stats = Table.grid(padding=(0, 2))
-        right_stats.add_column(style="bold cyan")
-        right_stats.add_column()
+        return Text(label, style="dim")
+
+    def __rich__(self) -> Panel:
+        """Render the display (Rich console protocol)."""
+        return self._build_display()
+
+    def _build_display(self) -> Panel:
+        """
+        Build the complete display panel.
+
+        Returns the cached panel when nothing changed since the last build. Worker
+        state lives in the orchestrator and changes without going through the
+        setters; the orchestrator publishes a new snapshot on every change, so
+        the snapshot the worker panel was built from is compared by identity.
+        """
+        # Current chunk info - ONLY for non-parallel mode
+        # In parallel mode, this info doesn't make sense (20 workers = 20 chunks)
+        # The worker panel shows per-worker chunk info instead
+        # Determine if we're in parallel mode by checking for active workers
+        worker_states = (
+            self.orchestrator.get_worker_states()
+            if self.orchestrator
+            else NO_WORKER_STATES
+        )
 
-        # Always show running cost (even when $0.0000)
-        running_cost = self.stats["running_cost_usd"]
-        right_stats.add_row(
-            "Running Cost:",
-            Text(f"${running_cost:.4f}", style="bold yellow"),
+        rate_limit_status = (
+            self._check_rate_limit_status() if self.orchestrator else NOT_RATE_LIMITED
+        )
+        rate_limited = rate_limit_status[0]
+        # While rate limited, the countdown changes every frame
+        workers_changed = (
+            rate_limited
+            or rate_limited != self._worker_panel_rate_limited
+            # Snapshots are replaced, never mutated, on every worker update
+            or worker_states is not self._worker_panel_states
         )
 
-        # Show token counts
-        input_tokens = self.stats["running_input_tokens"]
-        output_tokens = self.stats["running_output_tokens"]
-        right_stats.add_row("Input Tokens:", f"{input_tokens:,}")
-        right_stats.add_row("Output Tokens:", f"{output_tokens:,}")
+        revision = self._revision
+        if (
+            revision == self._rendered_revision
+            and not workers_changed
+            and self._cached_panel is not None
+        ):
+            return self._cached_panel
 
-        # Combine left and right stats in a container
-        stats_container = Table.grid(padding=(0, 4))
-        stats_container.add_column()  # Left column
-        stats_container.add_column()  # Right column
-        stats_container.add_row(left_stats, right_stats)
+        # Recorded before reading state, so a setter running during the build
+        # triggers another build on the next frame
+        self._rendered_revision = revision
+
+        # Main progress bar
+        components = [self.progress]
 
-        components.append(stats_container)
+        if not worker_states:
+            # Sequential mode - show current chunk info
+            self._refresh_chunk_table()
+            components.append(self._chunk_table)
 
-        # Worker panel (multi-worker mode)
-        worker_panel = self._build_worker_panel()
-        if worker_panel:
-            components.append(worker_panel)
+        self._refresh_stats_table()
+        components.append(self._stats_container)
+
+        # Worker panel (multi-worker mode), rebuilt only when worker state changed
+        if workers_changed:
+            self._worker_panel = self._build_worker_panel(
+                worker_states, rate_limit_status
+            )
+            self._worker_panel_states = worker_states
+            self._worker_panel_rate_limited = rate_limited
+        if self._worker_panel:
+            components.append(self._worker_panel)
 
         # Agent activity (verbose mode only)
         # Always show in verbose mode to maintain consistent panel height
         if self.verbose:
-            if self.agent_activity:
-                activity_text = "\n".join(self.agent_activity[-5:])  # Last 5 activities
-            else:
-                # Show placeholder to maintain consistent height
-                activity_text = "[dim]Waiting for agent activity...[/dim]"
-            components.append(
-                Panel(
-                    activity_text,
-                    title="[bold magenta]Agent Activity[/bold magenta]",
-                    border_style="magenta",
-                )
-            )
+            components.append(self._build_activity_panel())
 
         # Build final layout
-        layout = Table.grid()
-        layout.add_column()
-        for component in components:
-            layout.add_row(component)
-
-        # Build subtitle with data directory if available
-        subtitle = None
-        if self.data_dir:
-            # Show relative path if possible, otherwise just the name
-            try:
-                from pathlib import Path
-
-                cwd = Path.cwd()
-                try:
-                    rel_path = self.data_dir.relative_to(cwd)
-                    subtitle = f"[dim]{rel_path}[/dim]"
-                except ValueError:
-                    # Not relative to cwd, show name
-                    subtitle = f"[dim]{self.data_dir.name}[/dim]"
-            except Exception:
-                subtitle = f"[dim]{self.data_dir}[/dim]"
+        layout = Group(*components)
 
-        return Panel(
+        self._cached_panel = Panel(
             layout,
-            title="[bold blue]Knowledge Graph Extraction[/bold blue]",
-            subtitle=subtitle,
+            title=MAIN_TITLE,
+            subtitle=self._subtitle,
             border_style="blue",
         )
+        return self._cached_panel
 
     def print_success(
         self,
@@ -716,42 +984,47 @@ class ProgressDisplay:
             total_chunks: Total chunks processed
             duration: Total duration in seconds
         """
-        self.console.print()
-
-        # Build success message
-        message_parts = [
-            "[bold green]✓ Extraction Complete![/bold green]\n",
-            f"Chunks Processed: [cyan]{total_chunks}[/cyan]",
-            f"Entities Extracted: [cyan]{total_entities}[/cyan]",
-            f"Relationships: [cyan]{self.stats['relationships']}[/cyan]",
-        ]
+        # Build success message from pre-styled cells (no markup parsing)
+        summary = Table.grid(padding=(0, 1))
+        summary.add_column()
+        summary.add_column()
+        summary.add_row("Chunks Processed:", Text(str(total_chunks), style="cyan"))
+        summary.add_row("Entities Extracted:", Text(str(total_entities), style="cyan"))
+        summary.add_row(
+            "Relationships:", Text(str(self.stats["relationships"]), style="cyan")
+        )
 
         # Add graph metrics in verbose mode
         if self.verbose:
-            message_parts.extend(
-                [
-                    f"Average Degree: [cyan]{self.stats['average_degree']:.2f}[/cyan]",
-                    f"Graph Density: [cyan]{self.stats['graph_density']:.4f}[/cyan]",
-                ]
+            summary.add_row(
+                "Average Degree:",
+                Text(f"{self.stats['average_degree']:.2f}", style="cyan"),
+            )
+            summary.add_row(
+                "Graph Density:",
+                Text(f"{self.stats['graph_density']:.4f}", style="cyan"),
             )
 
-        message_parts.extend(
-            [
-                f"Validation Errors: [{'red' if self.stats['validation_errors'] > 0 else 'green'}]{self.stats['validation_errors']}[/]",
-                f"Duration: [cyan]{duration:.2f}s[/cyan]",
-            ]
+        summary.add_row(
+            "Validation Errors:",
+            Text(
+                str(self.stats["validation_errors"]),
+                style="red" if self.stats["validation_errors"] > 0 else "green",
+            ),
         )
+        summary.add_row("Duration:", Text(f"{duration:.2f}s", style="cyan"))
 
         # Add total cost if available
         if self.stats["running_cost_usd"] > 0:
-            message_parts.append(
-                f"Total Cost: [yellow]${self.stats['running_cost_usd']:.4f}[/yellow]"
+            summary.add_row(
+                "Total Cost:",
+                Text(f"${self.stats['running_cost_usd']:.4f}", style="yellow"),
             )
 
-        self.console.print(
+        self._write_panel(
             Panel(
-                "\n".join(message_parts),
-                title="[bold green]Success[/bold green]",
+                Group(Text("✓ Extraction Complete!\n", style="bold green"), summary),
+                title=SUCCESS_TITLE,
                 border_style="green",
             )
         )
@@ -763,11 +1036,24 @@ class ProgressDisplay:
         Args:
             error: Error message
         """
-        self.console.print()
-        self.console.print(
+        self._write_panel(
             Panel(
                 f"[bold red]✗ Extraction Failed[/bold red]\n\n{error}",
-                title="[bold red]Error[/bold red]",
+                title=ERROR_TITLE,
                 border_style="red",
             )
         )
+
+    def _write_panel(self, panel: Panel) -> None:
+        """
+        Print a panel (preceded by a blank line) with a single write to the terminal.
+
+        Args:
+            panel: Panel to print
+        """
+        with self.console.capture() as capture:
+            self.console.print()
+            self.console.print(panel)
+
+        self.console.file.write(capture.get())
+        self.console.file.flush()
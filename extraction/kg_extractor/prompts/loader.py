@@ -1,15 +1,16 @@
 """Prompt loader implementations."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
-from kg_extractor.prompts.models import (
-    PromptMetadata,
-    PromptTemplate,
-    PromptVariable,
-    TemplateError,
-)
+from kg_extractor.prompts.models import PromptTemplate, TemplateError
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class DiskPromptLoader:
@@ -19,7 +20,8 @@ class DiskPromptLoader:
     Implements: PromptLoader protocol (via structural subtyping)
 
     Loads prompt templates from YAML files on disk and caches them
-    for performance.
+    for performance. Safe to use from multiple threads; concurrent loads of
+    the same template read it from disk once.
     """
 
     def __init__(self, template_dir: Path):
@@ -31,6 +33,12 @@ class DiskPromptLoader:
         """
         self.template_dir = template_dir
         self._cache: dict[str, PromptTemplate] = {}
+        # Per-template locks serialize disk loads of one name without blocking
+        # loads of other names; _lock guards creating them
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        # Last list_templates() result, with the directory mtime it was listed at
+        self._list_cache: tuple[int, list[str]] | None = None
 
     def load(self, name: str) -> PromptTemplate:
         """
@@ -46,22 +54,49 @@ class DiskPromptLoader:
             FileNotFoundError: Template not found
             TemplateError: Failed to parse template
         """
-        if name in self._cache:
-            return self._cache[name]
-
-        template = self._load_from_disk(name)
-        self._cache[name] = template
-        return template
+        # Cache hits need no lock: a single dict lookup is atomic
+        template = self._cache.get(name)
+        if template is not None:
+            return template
+
+        with self._load_lock(name):
+            # Another thread may have loaded it while we waited
+            template = self._cache.get(name)
+            if template is None:
+                template = self._load_from_disk(name)
+                self._cache[name] = template
+            return template
 
     def list_templates(self) -> list[str]:
         """
         List all available templates.
 
+        The listing is cached until the directory's mtime changes, which
+        happens whenever a file is added, removed or renamed in it.
+
         Returns:
             List of template names (sorted alphabetically)
         """
-        templates = [f.stem for f in self.template_dir.glob("*.yaml")]
-        return sorted(templates)
+        try:
+            mtime_ns = os.stat(self.template_dir).st_mtime_ns
+            if self._list_cache is not None and self._list_cache[0] == mtime_ns:
+                return list(self._list_cache[1])
+
+            # scandir reuses the directory entries' file type instead of building
+            # a Path per entry; only symlinks need a stat for is_file()
+            with os.scandir(self.template_dir) as entries:
+                templates = [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            self._list_cache = None
+            return []
+
+        templates.sort()
+        self._list_cache = (mtime_ns, templates)
+        return list(templates)
 
     def reload(self, name: str) -> PromptTemplate:
         """
@@ -77,9 +112,23 @@ class DiskPromptLoader:
             FileNotFoundError: Template not found
             TemplateError: Failed to parse template
         """
-        template = self._load_from_disk(name)
-        self._cache[name] = template
-        return template
+        with self._load_lock(name):
+            template = self._load_from_disk(name)
+            self._cache[name] = template
+            return template
+
+    def _load_lock(self, name: str) -> threading.Lock:
+        """
+        Get the lock serializing disk loads of a template.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Lock for this template name
+        """
+        with self._lock:
+            return self._load_locks.setdefault(name, threading.Lock())
 
     def _load_from_disk(self, name: str) -> PromptTemplate:
         """
@@ -101,17 +150,26 @@ class DiskPromptLoader:
             raise FileNotFoundError(f"Prompt template not found: {template_file}")
 
         try:
-            with open(template_file) as f:
-                data = yaml.safe_load(f)
-
-            return PromptTemplate(
-                metadata=PromptMetadata(**data["metadata"]),
-                variables={
-                    k: PromptVariable(**v) for k, v in data.get("variables", {}).items()
-                },
-                system_prompt=data["system_prompt"],
-                user_prompt=data["user_prompt"],
+            # Templates are small: read them whole and let libyaml parse the
+            # raw bytes (it detects UTF-8/UTF-16 itself) instead of pulling
+            # decoded text through the io stack
+            data = yaml.load(template_file.read_bytes(), Loader=_YAML_LOADER)
+
+            # Validate the whole template in one pass; nested metadata and
+            # variables are validated by pydantic-core rather than through a
+            # Python-level constructor call per model
+            template = PromptTemplate.model_validate(
+                {
+                    "metadata": data["metadata"],
+                    "variables": data.get("variables", {}),
+                    "system_prompt": data["system_prompt"],
+                    "user_prompt": data["user_prompt"],
+                }
             )
+            # Compile up front so the cached template renders without compiling
+            # and syntax errors surface at load time
+            template._compile()
+            return template
         except Exception as e:
             raise TemplateError(f"Failed to load template {name}: {e}") from e
 
@@ -124,13 +182,34 @@ class DiskPromptLoader:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        for name in self.list_templates():
-            template = self.load(name)
-            doc = template.generate_documentation()
+        names = self.list_templates()
+        if not names:
+            return
+
+        # Each template is read, documented and written independently, so
+        # overlap the file IO across templates
+        max_workers = min(32, (os.cpu_count() or 1) * 2, len(names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so the first failure is raised here
+            for _ in executor.map(
+                lambda name: self._generate_doc(name, output_dir), names
+            ):
+                pass
+
+    def _generate_doc(self, name: str, output_dir: Path) -> None:
+        """
+        Generate documentation for one template.
+
+        Args:
+            name: Template name
+            output_dir: Directory to write the documentation file
+        """
+        template = self.load(name)
+        doc = template.generate_documentation()
 
-            doc_file = output_dir / f"{name}.md"
-            with open(doc_file, "w") as f:
-                f.write(doc)
+        doc_file = output_dir / f"{name}.md"
+        with open(doc_file, "w") as f:
+            f.write(doc)
 
     def clear_cache(self) -> None:
         """Clear template cache."""
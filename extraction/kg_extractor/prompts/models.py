@@ -1,9 +1,72 @@
 """Prompt template models."""
 
+import os
 from typing import Any
 
-from jinja2 import Environment, StrictUndefined, TemplateError as Jinja2TemplateError
-from pydantic import BaseModel, Field
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    StrictUndefined,
+    Template,
+    TemplateError as Jinja2TemplateError,
+)
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """
+    Create the on-disk Jinja2 bytecode cache, if enabled.
+
+    KG_JINJA_CACHE names a directory for compiled prompt bytecode, so a new
+    process can skip compiling prompts an earlier one already compiled.
+    Caching is off when it is unset.
+
+    Returns:
+        Bytecode cache, or None when disabled
+    """
+    directory = os.environ.get("KG_JINJA_CACHE")
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory=directory)
+
+
+# Shared Jinja2 environment (strict mode - fail on undefined)
+_JINJA_ENV = Environment(undefined=StrictUndefined, bytecode_cache=_bytecode_cache())
+
+
+def _compile_template(source: str) -> Template:
+    """
+    Compile a prompt template source, using the bytecode cache when enabled.
+
+    Environment.from_string never consults the bytecode cache, so this does
+    what a template loader does: look the source up by its checksum and
+    compile (and store) it only on a miss.
+
+    Args:
+        source: Jinja2 template source
+
+    Returns:
+        Compiled template
+
+    Raises:
+        jinja2.TemplateError: Invalid template syntax
+    """
+    bytecode_cache = _JINJA_ENV.bytecode_cache
+    if bytecode_cache is None:
+        return _JINJA_ENV.from_string(source)
+
+    # Key buckets by the source itself so each prompt gets its own cache file
+    bucket = bytecode_cache.get_bucket(_JINJA_ENV, source, None, source)
+    code = bucket.code
+    if code is None:
+        code = _JINJA_ENV.compile(source)
+        bucket.code = code
+        bytecode_cache.set_bucket(bucket)
+    return _JINJA_ENV.template_class.from_code(
+        _JINJA_ENV, code, _JINJA_ENV.make_globals(None)
+    )
 
 
 class PromptVariable(BaseModel):
@@ -66,6 +129,17 @@ class PromptTemplate(BaseModel):
     system_prompt: str = Field(description="Jinja2 template for system prompt")
     user_prompt: str = Field(description="Jinja2 template for user prompt")
 
+    # Compiled (system, user) templates, with the sources they were compiled from
+    _compiled: tuple[str, str, Template, Template] | None = PrivateAttr(default=None)
+    # Variable defaults and required names, with the variables they came from
+    _defaults: (
+        tuple[dict[str, PromptVariable], dict[str, Any], tuple[str, ...]] | None
+    ) = PrivateAttr(default=None)
+    # Generated documentation, with the metadata and variables it was generated from
+    _doc_cache: tuple[PromptMetadata, dict[str, PromptVariable], str] | None = (
+        PrivateAttr(default=None)
+    )
+
     def render(self, **kwargs: Any) -> tuple[str, str]:
         """
         Render system and user prompts with provided variables.
@@ -80,77 +154,137 @@ class PromptTemplate(BaseModel):
             ValueError: Missing required variable
             TemplateError: Invalid template syntax or undefined variable
         """
-        # Validate required variables (excluding those with defaults)
-        missing = [
-            name
-            for name, var in self.variables.items()
-            if var.required and name not in kwargs and var.default is None
-        ]
-        if missing:
-            raise ValueError(f"Missing required variables: {', '.join(missing)}")
-
-        # Apply defaults
-        render_vars = {
-            name: kwargs.get(name, var.default) for name, var in self.variables.items()
-        }
+        if not self.variables:
+            # Nothing to check or default; kwargs is already a fresh dict
+            render_vars = kwargs
+        else:
+            defaults, required = self._variable_defaults()
 
-        # Add any extra kwargs not in variable definitions
-        for key, value in kwargs.items():
-            if key not in render_vars:
-                render_vars[key] = value
+            # Validate required variables (excluding those with defaults)
+            missing = [name for name in required if name not in kwargs]
+            if missing:
+                raise ValueError(f"Missing required variables: {', '.join(missing)}")
 
-        # Render with Jinja2 (strict mode - fail on undefined)
-        env = Environment(undefined=StrictUndefined)
+            # Apply defaults; provided values and extra kwargs override them
+            render_vars = {**defaults, **kwargs}
 
         try:
-            system = env.from_string(self.system_prompt).render(**render_vars)
-            user = env.from_string(self.user_prompt).render(**render_vars)
+            system_template, user_template = self._compile()
+            system = system_template.render(**render_vars)
+            user = user_template.render(**render_vars)
             return system, user
         except Jinja2TemplateError as e:
             raise TemplateError(f"Failed to render template: {e}") from e
 
+    def _variable_defaults(self) -> tuple[dict[str, Any], tuple[str, ...]]:
+        """
+        Get variable defaults and required variable names.
+
+        Computed once and reused until variables is reassigned.
+
+        Returns:
+            Tuple of (defaults by variable name, names of required variables
+            without a default)
+        """
+        cached = self._defaults
+        if cached is None or cached[0] is not self.variables:
+            variables = self.variables
+            cached = (
+                variables,
+                {name: var.default for name, var in variables.items()},
+                tuple(
+                    name
+                    for name, var in variables.items()
+                    if var.required and var.default is None
+                ),
+            )
+            self._defaults = cached
+        return cached[1], cached[2]
+
+    def _compile(self) -> tuple[Template, Template]:
+        """
+        Compile system and user prompts, reusing the last compilation.
+
+        The prompts are recompiled only if either source has been reassigned.
+
+        Returns:
+            Tuple of (system_template, user_template)
+
+        Raises:
+            jinja2.TemplateError: Invalid template syntax
+        """
+        compiled = self._compiled
+        if (
+            compiled is None
+            or compiled[0] is not self.system_prompt
+            or compiled[1] is not self.user_prompt
+        ):
+            compiled = (
+                self.system_prompt,
+                self.user_prompt,
+                _compile_template(self.system_prompt),
+                _compile_template(self.user_prompt),
+            )
+            self._compiled = compiled
+        return compiled[2], compiled[3]
+
     def generate_documentation(self) -> str:
         """
         Generate markdown documentation for this prompt.
 
+        The result is cached until metadata or variables is reassigned.
+
         Returns:
             Markdown documentation string
         """
-        doc = f"# {self.metadata.name} (v{self.metadata.version})\n\n"
-        doc += f"{self.metadata.description}\n\n"
-
-        # Metadata
-        doc += "## Metadata\n\n"
-        doc += f"- **Author**: {self.metadata.author}\n"
-        doc += f"- **Created**: {self.metadata.created}\n"
-        if self.metadata.updated:
-            doc += f"- **Updated**: {self.metadata.updated}\n"
-        doc += "\n"
+        cached = self._doc_cache
+        if (
+            cached is not None
+            and cached[0] is self.metadata
+            and cached[1] is self.variables
+        ):
+            return cached[2]
+
+        metadata = self.metadata
+        variables = self.variables.items()
+        parts = [
+            f"# {metadata.name} (v{metadata.version})\n\n",
+            f"{metadata.description}\n\n",
+            # Metadata
+            "## Metadata\n\n",
+            f"- **Author**: {metadata.author}\n",
+            f"- **Created**: {metadata.created}\n",
+        ]
+        if metadata.updated:
+            parts.append(f"- **Updated**: {metadata.updated}\n")
+        parts.append("\n")
 
         # Variables
-        doc += "## Variables\n\n"
-        for name, var in self.variables.items():
-            doc += f"### `{name}`\n\n"
-            doc += f"- **Type**: `{var.type}`\n"
-            doc += f"- **Required**: {'Yes' if var.required else 'No'}\n"
+        parts.append("## Variables\n\n")
+        for name, var in variables:
+            parts.append(f"### `{name}`\n\n")
+            parts.append(f"- **Type**: `{var.type}`\n")
+            parts.append(f"- **Required**: {'Yes' if var.required else 'No'}\n")
             if var.default is not None:
-                doc += f"- **Default**: `{var.default}`\n"
-            doc += f"- **Description**: {var.description}\n"
+                parts.append(f"- **Default**: `{var.default}`\n")
+            parts.append(f"- **Description**: {var.description}\n")
             if var.example is not None:
-                doc += f"- **Example**: `{var.example}`\n"
-            doc += "\n"
+                parts.append(f"- **Example**: `{var.example}`\n")
+            parts.append("\n")
 
         # Example usage
-        doc += "## Example Usage\n\n"
-        doc += "```python\n"
-        doc += f'template = loader.load("{self.metadata.name}")\n'
-        doc += "system, user = template.render(\n"
-        for name, var in self.variables.items():
+        parts.append("## Example Usage\n\n")
+        parts.append("```python\n")
+        parts.append(f'template = loader.load("{metadata.name}")\n')
+        parts.append("system, user = template.render(\n")
+        for name, var in variables:
             if var.example is not None:
-                doc += f"    {name}={repr(var.example)},\n"
-        doc += ")\n"
-        doc += "```\n\n"
+                parts.append(f"    {name}={repr(var.example)},\n")
+        parts.append(")\n")
+        parts.append("```\n\n")
 
+        doc = "".join(parts)
+        self._doc_cache = (self.metadata, self.variables, doc)
         return doc
 
     def list_variables(self) -> list[str]:
@@ -1,44 +1,119 @@
 """Entity validation implementation."""
 
-import re
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any
 
 from kg_extractor.config import ValidationConfig
-from kg_extractor.models import Entity, ValidationError
+from kg_extractor.models import (
+    ALNUM_UNDERSCORE_RE,
+    TYPE_NAME_RE,
+    URN_STRICT_RE,
+    Entity,
+    ValidationError,
+)
 
+# Keys every Entity has when viewed as an entity dict
+_ENTITY_KEYS = frozenset({"@id", "@type", "name"})
 
-def extract_urn_references(value: Any) -> set[str]:
+# Sentinel for keys absent from an entity dict
+_MISSING: Any = object()
+
+# Entities per work item when graph validation runs in parallel
+_GRAPH_CHUNK_SIZE = 2048
+
+
+def extract_urn_references(
+    value: Any, skip_keys: frozenset[str] = frozenset()
+) -> set[str]:
     """
     Extract URN references from a value (could be dict, list, string, etc.).
 
     Args:
         value: Value to extract URNs from
+        skip_keys: Dict keys whose values are not scanned, at any depth
 
     Returns:
         Set of URN strings found
     """
     urns = set()
 
-    if isinstance(value, dict):
-        # Check if this is a reference object {"@id": "urn:..."}
-        if "@id" in value and isinstance(value["@id"], str):
-            if value["@id"].startswith("urn:"):
-                urns.add(value["@id"])
-        # Recursively check all values
-        for v in value.values():
-            urns.update(extract_urn_references(v))
-    elif isinstance(value, list):
-        # Recursively check all list items
-        for item in value:
-            urns.update(extract_urn_references(item))
-    elif isinstance(value, str):
-        # Direct URN string
-        if value.startswith("urn:"):
-            urns.add(value)
+    # Walk nested dicts and lists with an explicit stack instead of recursion.
+    # Reference objects {"@id": "urn:..."} need no special case: their "@id"
+    # string is pushed with the other values and collected below.
+    stack = [value]
+    pop = stack.pop
+    push = stack.append
+    push_all = stack.extend
+    while stack:
+        item = pop()
+        if isinstance(item, str):
+            # Direct URN string
+            if item.startswith("urn:"):
+                urns.add(item)
+        elif isinstance(item, dict):
+            if skip_keys:
+                for key, child in item.items():
+                    if key not in skip_keys:
+                        push(child)
+            else:
+                push_all(item.values())
+        elif isinstance(item, list):
+            push_all(item)
 
     return urns
 
 
+def _is_empty_value(value: Any) -> bool:
+    """Whether Entity.to_jsonld() drops a property value (None or empty lists)."""
+    return value is None or (
+        isinstance(value, list) and all(map(_is_empty_value, value))
+    )
+
+
+def entity_urn_references(
+    entity: Entity, skip_keys: frozenset[str] = frozenset()
+) -> set[str]:
+    """
+    Extract URN references from an entity without serializing it.
+
+    Equivalent to extract_urn_references(entity.to_jsonld(), skip_keys):
+    normalization only wraps and flattens values, so the same strings are
+    scanned from the entity's own fields.
+
+    Args:
+        entity: Entity to scan
+        skip_keys: Dict keys whose values are not scanned, at any depth
+
+    Returns:
+        Set of URN strings found (including the entity's own ID)
+    """
+    if "@id" in skip_keys:
+        # to_jsonld() wraps plain URN strings as {"@id": ...}, hiding them
+        return extract_urn_references(entity.to_jsonld(), skip_keys)
+
+    properties = entity.properties
+    values: list[Any] = []
+
+    # Core fields, unless a property with the same key replaces them
+    for key, value in (
+        ("@id", entity.id),
+        ("@type", entity.type),
+        ("name", entity.name),
+        ("description", entity.description),
+    ):
+        if value and key not in skip_keys and _is_empty_value(properties.get(key)):
+            values.append(value)
+
+    for key, value in properties.items():
+        if key not in skip_keys:
+            values.append(value)
+
+    return extract_urn_references(values, skip_keys)
+
+
 class EntityValidator:
     """
     Entity validator for knowledge graph extraction.
@@ -57,6 +132,21 @@ class EntityValidator:
             config: Validation configuration
         """
         self.config = config
+        # Config values read on every validation, copied to plain attributes
+        self._required_set = frozenset(config.required_fields)
+        self._allow_missing_name = config.allow_missing_name
+        self._strict_urn_format = config.strict_urn_format
+        self._detect_orphans = config.detect_orphans
+        self._detect_broken_refs = config.detect_broken_refs
+        self._non_reference_keys = frozenset(config.non_reference_keys)
+        self._parallel_threshold = (
+            config.parallel_validation_threshold if config.parallel_validation else None
+        )
+        # The error for each missing required field is fixed by the config,
+        # so resolve messages and severities once, in configured field order
+        self._required_field_rules = tuple(
+            self._required_field_rule(field) for field in config.required_fields
+        )
 
     def validate(self, entity: Entity) -> list[ValidationError]:
         """
@@ -68,20 +158,56 @@ class EntityValidator:
         Returns:
             List of validation errors (empty if valid)
         """
-        # Convert entity to dict for validation
-        entity_dict = {
-            "@id": entity.id,
-            "@type": entity.type,
-            "name": entity.name,
-        }
+        return self.validate_many((entity,))
+
+    def validate_many(self, entities: Iterable[Entity]) -> list[ValidationError]:
+        """
+        Validate a batch of Entity objects in a single pass.
 
-        if entity.description:
-            entity_dict["description"] = entity.description
+        Equivalent to concatenating validate() results for each entity.
 
-        # Add properties
-        entity_dict.update(entity.properties)
+        Args:
+            entities: Entities to validate
+
+        Returns:
+            List of validation errors across all entities (empty if all valid)
+        """
+        errors: list[ValidationError] = []
+        extend = errors.extend
+        required_set = self._required_set
+        validate_required_fields = self._validate_required_fields
+        validate_urn_format = self._validate_urn_format
+        validate_type_name = self._validate_type_name
+        # Valid entities are the common case: when strict URN checking is on,
+        # they are recognised inline and never reach the per-check methods
+        urn_match = URN_STRICT_RE.match if self._strict_urn_format else None
+        type_name_match = TYPE_NAME_RE.fullmatch
+
+        for entity in entities:
+            # Validate as the equivalent entity dict (core fields, description
+            # if set, then properties) without building it
+            properties = entity.properties
+            missing = required_set.difference(_ENTITY_KEYS, properties)
+            if missing and entity.description:
+                missing = missing.difference(("description",))
+
+            # Properties may shadow the core fields, as they would in the dict
+            entity_id = properties.get("@id", entity.id)
+            type_name = properties.get("@type", entity.type)
+
+            if (
+                not missing
+                and urn_match is not None
+                and urn_match(entity_id)
+                and type_name_match(type_name)
+            ):
+                continue
+
+            extend(validate_required_fields(missing, entity_id))
+            extend(validate_urn_format(entity_id, entity_id))
+            extend(validate_type_name(type_name, entity_id))
 
-        return self.validate_dict(entity_dict)
+        return errors
 
     def validate_dict(self, entity_dict: dict[str, Any]) -> list[ValidationError]:
         """
@@ -93,63 +219,67 @@ class EntityValidator:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        # Look up @id and @type once; _MISSING distinguishes absent keys
+        urn = entity_dict.get("@id", _MISSING)
+        type_name = entity_dict.get("@type", _MISSING)
 
         # Get entity ID for error reporting
-        entity_id = entity_dict.get("@id", "unknown")
+        entity_id = "unknown" if urn is _MISSING else urn
 
-        # Validate required fields
-        errors.extend(self._validate_required_fields(entity_dict, entity_id))
+        # Validate required fields (set difference against the keys runs in C)
+        errors = self._validate_required_fields(
+            self._required_set.difference(entity_dict), entity_id
+        )
 
         # Validate URN format
-        if "@id" in entity_dict:
-            errors.extend(self._validate_urn_format(entity_dict["@id"], entity_id))
+        if urn is not _MISSING:
+            errors.extend(self._validate_urn_format(urn, entity_id))
 
         # Validate type name format
-        if "@type" in entity_dict:
-            errors.extend(self._validate_type_name(entity_dict["@type"], entity_id))
+        if type_name is not _MISSING:
+            errors.extend(self._validate_type_name(type_name, entity_id))
 
         return errors
 
     def _validate_required_fields(
-        self, entity_dict: dict[str, Any], entity_id: str
+        self, missing: frozenset[str], entity_id: str
     ) -> list[ValidationError]:
         """
-        Validate required fields are present.
+        Report missing required fields.
 
         Args:
-            entity_dict: Entity dictionary
+            missing: Required fields absent from the entity
             entity_id: Entity ID for error reporting
 
         Returns:
-            List of validation errors
+            List of validation errors, in configured field order
         """
-        errors = []
+        if not missing:
+            return []
 
-        for field in self.config.required_fields:
-            if field not in entity_dict:
-                # Special handling for name field
-                if field == "name" and self.config.allow_missing_name:
-                    # Allow missing name, but maybe warn
-                    errors.append(
-                        ValidationError(
-                            entity_id=entity_id,
-                            field=field,
-                            message=f"Missing optional field: {field}",
-                            severity="warning",
-                        )
-                    )
-                else:
-                    errors.append(
-                        ValidationError(
-                            entity_id=entity_id,
-                            field=field,
-                            message=f"Missing required field: {field}",
-                            severity="error",
-                        )
-                    )
+        return [
+            ValidationError(
+                entity_id=entity_id, field=field, message=message, severity=severity
+            )
+            for field, message, severity in self._required_field_rules
+            if field in missing
+        ]
 
-        return errors
+    def _required_field_rule(self, field: str) -> tuple[str, str, str]:
+        """
+        Resolve the error reported when a required field is missing.
+
+        Args:
+            field: Required field name
+
+        Returns:
+            Tuple of (field, message, severity)
+        """
+        # Special handling for name field
+        if field == "name" and self._allow_missing_name:
+            # Allow missing name, but maybe warn
+            return field, f"Missing optional field: {field}", "warning"
+        return field, f"Missing required field: {field}", "error"
 
     def _validate_urn_format(self, urn: str, entity_id: str) -> list[ValidationError]:
         """
@@ -166,7 +296,10 @@ class EntityValidator:
         """
         errors = []
 
-        if self.config.strict_urn_format:
+        if self._strict_urn_format:
+            if URN_STRICT_RE.match(urn):
+                return errors
+
             # Strict validation: must start with "urn:" and have at least 3 parts
             if not urn.startswith("urn:"):
                 errors.append(
@@ -178,8 +311,7 @@ class EntityValidator:
                     )
                 )
 
-            parts = urn.split(":")
-            if len(parts) < 3:
+            if urn.count(":") < 2:
                 errors.append(
                     ValidationError(
                         entity_id=entity_id,
@@ -232,6 +364,9 @@ class EntityValidator:
             )
             return errors
 
+        if TYPE_NAME_RE.fullmatch(type_name):
+            return errors
+
         # Check if starts with capital letter
         if not type_name[0].isupper():
             errors.append(
@@ -244,7 +379,7 @@ class EntityValidator:
             )
 
         # Check if alphanumeric (allowing underscores)
-        if not type_name.replace("_", "").isalnum():
+        if not ALNUM_UNDERSCORE_RE.fullmatch(type_name):
             errors.append(
                 ValidationError(
                     entity_id=entity_id,
@@ -270,25 +405,117 @@ class EntityValidator:
         Returns:
             List of validation errors
         """
-        errors = []
+        if not (self._detect_orphans or self._detect_broken_refs):
+            return []
+
+        # Build entity ID set for reference checking (frozen: it is shared
+        # read-only between workers)
+        entity_ids = frozenset(entity.id for entity in entities)
+
+        threshold = self._parallel_threshold
+        if threshold is None or len(entities) < threshold:
+            entity_refs = self._collect_references(entities)
+            referenced_urns = self._referenced_urns(entity_refs)
+            return self._check_graph_chunk(
+                entities, entity_refs, entity_ids, referenced_urns
+            )
 
-        # Build entity ID set for reference checking
-        entity_ids = {entity.id for entity in entities}
+        # Each phase is independent per entity: split the graph into chunks
+        # and run them in a thread pool. map() keeps results in entity order
+        bounds = range(0, len(entities), _GRAPH_CHUNK_SIZE)
+        chunks = [entities[i : i + _GRAPH_CHUNK_SIZE] for i in bounds]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            chunk_refs = list(executor.map(self._collect_references, chunks))
+            referenced_urns = self._referenced_urns(chain.from_iterable(chunk_refs))
+            chunk_errors = executor.map(
+                self._check_graph_chunk,
+                chunks,
+                chunk_refs,
+                [entity_ids] * len(chunks),
+                [referenced_urns] * len(chunks),
+            )
+            return list(chain.from_iterable(chunk_errors))
 
-        # Check each entity
+    def _collect_references(self, entities: list[Entity]) -> list[set[str]]:
+        """
+        Scan each entity once for the URNs it references, excluding its own.
+
+        Args:
+            entities: Entities to scan
+
+        Returns:
+            One set of referenced URNs per entity, in entity order
+        """
+        entity_refs: list[set[str]] = []
+        non_reference_keys = self._non_reference_keys
         for entity in entities:
+            refs = entity_urn_references(entity, non_reference_keys)
+            # Remove self-reference
+            refs.discard(entity.id)
+            entity_refs.append(refs)
+        return entity_refs
+
+    def _referenced_urns(self, entity_refs: Iterable[set[str]]) -> frozenset[str]:
+        """
+        Union the references of all entities, for orphan detection.
+
+        Only graph IDs are ever looked up in the result, so it need not be
+        filtered.
+
+        Args:
+            entity_refs: Per-entity reference sets
+
+        Returns:
+            Every URN referenced by some entity (empty if orphans are not checked)
+        """
+        if not self._detect_orphans:
+            return frozenset()
+        return frozenset().union(*entity_refs)
+
+    def _check_graph_chunk(
+        self,
+        entities: list[Entity],
+        entity_refs: list[set[str]],
+        entity_ids: frozenset[str],
+        referenced_urns: frozenset[str],
+    ) -> list[ValidationError]:
+        """
+        Run the orphan and broken-reference checks on a run of entities.
+
+        Args:
+            entities: Entities to check
+            entity_refs: References of each entity, from _collect_references()
+            entity_ids: IDs of all entities in the graph
+            referenced_urns: URNs referenced by any entity in the graph
+
+        Returns:
+            List of validation errors, in entity order
+        """
+        errors = []
+        detect_orphans = self._detect_orphans
+        detect_broken_refs = self._detect_broken_refs
+
+        # Check each entity
+        for entity, refs in zip(entities, entity_refs, strict=True):
             # Check for orphaned entities
-            if self.config.detect_orphans:
-                errors.extend(self._detect_orphaned_entity(entity, entity_ids))
+            if detect_orphans:
+                errors.extend(
+                    self._detect_orphaned_entity(
+                        entity, not refs.isdisjoint(entity_ids), referenced_urns
+                    )
+                )
 
             # Check for broken references
-            if self.config.detect_broken_refs:
-                errors.extend(self._detect_broken_references(entity, entity_ids))
+            if detect_broken_refs:
+                errors.extend(self._detect_broken_references(entity, refs, entity_ids))
 
         return errors
 
     def _detect_orphaned_entity(
-        self, entity: Entity, all_entity_ids: set[str]
+        self,
+        entity: Entity,
+        has_outgoing_refs: bool,
+        referenced_urns: frozenset[str],
     ) -> list[ValidationError]:
         """
         Detect if entity has no relationships (orphaned).
@@ -299,27 +526,15 @@ class EntityValidator:
 
         Args:
             entity: Entity to check
-            all_entity_ids: Set of all entity IDs in graph
+            has_outgoing_refs: Whether the entity references another graph entity
+            referenced_urns: URNs referenced by any other entity
 
         Returns:
             List of validation errors
         """
         errors = []
 
-        # Check if entity has any outgoing references
-        entity_dict = entity.to_jsonld()
-        referenced_urns = extract_urn_references(entity_dict)
-
-        # Remove self-reference
-        referenced_urns.discard(entity.id)
-
-        # Filter to only URNs that exist in the graph
-        outgoing_refs = referenced_urns & all_entity_ids
-
-        # For now, just check outgoing references
-        # Checking incoming would require scanning all entities which is expensive
-        # We could add that as an optional check later
-        if not outgoing_refs:
+        if not has_outgoing_refs and entity.id not in referenced_urns:
             errors.append(
                 ValidationError(
                     entity_id=entity.id,
@@ -332,13 +547,17 @@ class EntityValidator:
         return errors
 
     def _detect_broken_references(
-        self, entity: Entity, all_entity_ids: set[str]
+        self,
+        entity: Entity,
+        referenced_urns: set[str],
+        all_entity_ids: frozenset[str],
     ) -> list[ValidationError]:
         """
         Detect broken references (URNs that don't exist in graph).
 
         Args:
             entity: Entity to check
+            referenced_urns: URNs the entity references, excluding its own
             all_entity_ids: Set of all entity IDs in graph
 
         Returns:
@@ -346,13 +565,6 @@ class EntityValidator:
         """
         errors = []
 
-        # Extract all URN references from entity
-        entity_dict = entity.to_jsonld()
-        referenced_urns = extract_urn_references(entity_dict)
-
-        # Remove self-reference
-        referenced_urns.discard(entity.id)
-
         # Find broken references (URNs that don't exist in graph)
         broken_refs = referenced_urns - all_entity_ids
 
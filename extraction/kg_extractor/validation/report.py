@@ -2,12 +2,23 @@
 
 import json
 from collections import defaultdict
+from collections.abc import Iterator
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from kg_extractor.models import ValidationError
 
 
+def _import_orjson() -> Any:
+    """Return the orjson module, or None when it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
 class ValidationReport:
     """
     Validation report aggregating and formatting validation errors.
@@ -18,6 +29,19 @@ class ValidationReport:
     - Text: Simple console output
     """
 
+    __slots__ = (
+        "errors",
+        "by_severity",
+        "entity_ids_with_errors",
+        "total_errors",
+        "total_error_severity",
+        "total_warning_severity",
+        "total_entities_with_errors",
+        # Lazily computed groupings (see by_field, by_severity_message)
+        "_by_field",
+        "_by_severity_message",
+    )
+
     def __init__(self, errors: list[ValidationError]):
         """
         Initialize validation report.
@@ -26,28 +50,89 @@ class ValidationReport:
             errors: List of validation errors to report
         """
         self.errors = errors
+        self._by_field: dict[str, list[ValidationError]] | None = None
+        self._by_severity_message: (
+            dict[str, dict[str, list[ValidationError]]] | None
+        ) = None
         self._analyze()
 
     def _analyze(self) -> None:
-        """Analyze errors to compute statistics."""
-        # Group by severity
-        self.by_severity: dict[str, list[ValidationError]] = defaultdict(list)
-        for error in self.errors:
-            self.by_severity[error.severity].append(error)
+        """
+        Analyze errors to compute statistics in a single pass.
 
-        # Group by field
-        self.by_field: dict[str, list[ValidationError]] = defaultdict(list)
-        for error in self.errors:
-            self.by_field[error.field].append(error)
+        Every export needs these; the field grouping is only used by some
+        and is computed on first access (see by_field).
+        """
+        by_severity: dict[str, list[ValidationError]] = defaultdict(list)
+        entity_ids: set[str] = set()
+        add_entity_id = entity_ids.add
+        error_count = 0
+        warning_count = 0
 
-        # Count unique entities with errors
-        self.entity_ids_with_errors = {error.entity_id for error in self.errors}
+        for error in self.errors:
+            severity = error.severity
+            # Group by severity
+            by_severity[severity].append(error)
+            # Track unique entities with errors
+            add_entity_id(error.entity_id)
+            if severity == "error":
+                error_count += 1
+            elif severity == "warning":
+                warning_count += 1
+
+        self.by_severity = by_severity
+        self.entity_ids_with_errors = entity_ids
 
         # Compute totals
         self.total_errors = len(self.errors)
-        self.total_error_severity = len(self.by_severity.get("error", []))
-        self.total_warning_severity = len(self.by_severity.get("warning", []))
-        self.total_entities_with_errors = len(self.entity_ids_with_errors)
+        self.total_error_severity = error_count
+        self.total_warning_severity = warning_count
+        self.total_entities_with_errors = len(entity_ids)
+
+    @property
+    def by_field(self) -> dict[str, list[ValidationError]]:
+        """
+        Errors grouped by field.
+
+        Computed on first access: text output and print_summary() never use it.
+
+        Returns:
+            Errors keyed by field name
+        """
+        if self._by_field is not None:
+            return self._by_field
+
+        by_field: dict[str, list[ValidationError]] = defaultdict(list)
+        for error in self.errors:
+            by_field[error.field].append(error)
+        self._by_field = by_field
+        return by_field
+
+    @property
+    def by_severity_message(self) -> dict[str, dict[str, list[ValidationError]]]:
+        """
+        Errors grouped by severity, then by message.
+
+        Computed on first access, in one pass over the errors.
+
+        Returns:
+            Errors keyed by severity and then by message
+        """
+        if self._by_severity_message is not None:
+            return self._by_severity_message
+
+        grouped: dict[str, dict[str, list[ValidationError]]] = {}
+        for error in self.errors:
+            by_message = grouped.get(error.severity)
+            if by_message is None:
+                by_message = grouped[error.severity] = {}
+            message_errors = by_message.get(error.message)
+            if message_errors is None:
+                by_message[error.message] = [error]
+            else:
+                message_errors.append(error)
+        self._by_severity_message = grouped
+        return grouped
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -89,6 +174,21 @@ class ValidationReport:
         """
         return json.dumps(self.to_dict(), indent=indent)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Export report as UTF-8 encoded JSON (2-space indent).
+
+        Uses orjson when installed, which serializes straight to bytes.
+
+        Returns:
+            JSON bytes
+        """
+        orjson = _import_orjson()
+        if orjson is None:
+            return self.to_json().encode("utf-8")
+
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+
     def to_markdown(self) -> str:
         """
         Export report as Markdown.
@@ -96,64 +196,68 @@ class ValidationReport:
         Returns:
             Markdown string
         """
-        lines = []
+        return "\n".join(self._iter_markdown())
 
-        # Header
-        lines.append("# Validation Report")
-        lines.append("")
+    def _iter_markdown(self) -> Iterator[str]:
+        """
+        Generate the Markdown report line by line.
 
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Total Issues**: {self.total_errors}")
-        lines.append(f"- **Errors**: {self.total_error_severity}")
-        lines.append(f"- **Warnings**: {self.total_warning_severity}")
-        lines.append(f"- **Entities Affected**: {self.total_entities_with_errors}")
-        lines.append("")
+        Yields:
+            Report lines, without trailing newlines
+        """
+        # Header and summary
+        yield from (
+            "# Validation Report",
+            "",
+            "## Summary",
+            "",
+            f"- **Total Issues**: {self.total_errors}",
+            f"- **Errors**: {self.total_error_severity}",
+            f"- **Warnings**: {self.total_warning_severity}",
+            f"- **Entities Affected**: {self.total_entities_with_errors}",
+            "",
+        )
 
         # By Severity
         if self.by_severity:
-            lines.append("## Issues by Severity")
-            lines.append("")
+            yield from ("## Issues by Severity", "")
 
+            by_severity_message = self.by_severity_message
             for severity in ["error", "warning"]:
-                if severity in self.by_severity:
-                    errors = self.by_severity[severity]
-                    lines.append(f"### {severity.upper()} ({len(errors)})")
-                    lines.append("")
-
-                    # Group by message for readability
-                    by_message: dict[str, list[ValidationError]] = defaultdict(list)
-                    for error in errors:
-                        by_message[error.message].append(error)
-
-                    for message, message_errors in sorted(by_message.items()):
-                        lines.append(
-                            f"**{message}** ({len(message_errors)} occurrences)"
-                        )
-                        lines.append("")
+                if severity in by_severity_message:
+                    yield f"### {severity.upper()} ({len(self.by_severity[severity])})"
+                    yield ""
+
+                    # Grouped by message for readability
+                    for message, message_errors in sorted(
+                        by_severity_message[severity].items()
+                    ):
+                        yield f"**{message}** ({len(message_errors)} occurrences)"
+                        yield ""
                         # Show first 5 entities
                         for error in message_errors[:5]:
-                            lines.append(
-                                f"- `{error.entity_id}` (field: `{error.field}`)"
-                            )
+                            yield f"- `{error.entity_id}` (field: `{error.field}`)"
                         if len(message_errors) > 5:
-                            lines.append(f"- ... and {len(message_errors) - 5} more")
-                        lines.append("")
+                            yield f"- ... and {len(message_errors) - 5} more"
+                        yield ""
 
         # By Field
         if self.by_field:
-            lines.append("## Issues by Field")
-            lines.append("")
-            lines.append("| Field | Count |")
-            lines.append("|-------|-------|")
-            for field, errors in sorted(
-                self.by_field.items(), key=lambda x: -len(x[1])
-            ):
-                lines.append(f"| `{field}` | {len(errors)} |")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield from (
+                "## Issues by Field",
+                "",
+                "| Field | Count |",
+                "|-------|-------|",
+            )
+            # Measure each field once; the sort is stable, so fields with
+            # equal counts stay in first-seen order
+            field_counts = [
+                (field, len(errors)) for field, errors in self.by_field.items()
+            ]
+            field_counts.sort(key=itemgetter(1), reverse=True)
+            for field, count in field_counts:
+                yield f"| `{field}` | {count} |"
+            yield ""
 
     def to_text(self) -> str:
         """
@@ -199,16 +303,28 @@ class ValidationReport:
         Raises:
             ValueError: If format is unknown
         """
-        if format == "json":
-            content = self.to_json()
-        elif format == "markdown":
-            content = self.to_markdown()
-        elif format == "text":
-            content = self.to_text()
-        else:
+        if format not in ("json", "markdown", "text"):
             raise ValueError(f"Unknown format: {format}")
 
-        path.write_text(content, encoding="utf-8")
+        if format == "json" and _import_orjson() is not None:
+            # orjson serializes straight to bytes faster than json.dump streams
+            path.write_bytes(self.to_json_bytes())
+            return
+
+        # Stream JSON and Markdown to the file instead of building the whole
+        # report string first; the text report is capped at 10 issues per
+        # severity, so it is written in one go
+        with path.open("w", encoding="utf-8") as f:
+            if format == "json":
+                json.dump(self.to_dict(), f, indent=2)
+            elif format == "markdown":
+                lines = self._iter_markdown()
+                f.write(next(lines, ""))
+                for line in lines:
+                    f.write("\n")
+                    f.write(line)
+            else:
+                f.write(self.to_text())
 
     def print_summary(self) -> None:
         """Print summary to console."""
@@ -2,7 +2,8 @@
 """
 Load JSON-LD knowledge graph into Dgraph.
 
-Converts JSON-LD format to Dgraph RDF/mutations and loads via HTTP API.
+Converts JSON-LD format to Dgraph RDF/mutations and loads via dgraph live,
+falling back to gRPC transactions (with pydgraph installed) or the HTTP API.
 Validates data before loading and creates schema automatically.
 
 Usage:
@@ -11,15 +12,33 @@ Usage:
 """
 
 import argparse
+import functools
+import gzip
+import itertools
 import json
 import os
+import random
 import subprocess
 import sys
 import tempfile
+import time
 import urllib.parse
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Dict, List, Set
 import requests
 
+try:
+    import ijson  # Optional: stream "@graph" entities (pip install ".[stream]")
+except ImportError:
+    ijson = None
+
+try:
+    import pydgraph  # Optional: load over gRPC (pip install ".[dgraph]")
+except ImportError:
+    pydgraph = None
+
 
 class DgraphLoader:
     def __init__(
@@ -28,11 +47,13 @@ class DgraphLoader:
         drop_all: bool = False,
         grpc_port: int = None,
         zero_port: int = None,
+        workers: int = 1,
     ):
         self.dgraph_url = dgraph_url.rstrip("/")
         self.drop_all = drop_all
         self.grpc_port = grpc_port  # Optional override for gRPC port
         self.zero_port = zero_port  # Optional override for Zero port
+        self.workers = workers  # Processes for analysis/conversion (1 = inline)
         self.predicate_types: Dict[str, str] = {}
         self.predicate_type_observations: Dict[str, Set[str]] = (
             {}
@@ -56,24 +77,53 @@ class DgraphLoader:
 
         return data
 
-    def validate_jsonld(self, jsonld: Dict[str, Any]) -> bool:
+    def iter_entities(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entities from the JSON-LD "@graph" array one at a time.
+
+        Uses ijson when installed, so the document is never held in memory;
+        otherwise falls back to load_jsonld().
+        """
+        if ijson is None:
+            yield from self.load_jsonld(filepath)["@graph"]
+            return
+
+        with open(filepath, "rb") as f:
+            # Stops at the "@graph" key, so only what precedes it is scanned
+            if not any(
+                prefix == "" and event == "map_key" and value == "@graph"
+                for prefix, event, value in ijson.parse(f)
+            ):
+                raise ValueError("Invalid JSON-LD: missing '@graph' key")
+
+            f.seek(0)
+            yield from ijson.items(f, "@graph.item", use_float=True)
+
+    def validate_jsonld(self, entities: Iterable[Dict[str, Any]]) -> bool:
         """Validate JSON-LD structure."""
         print("🔍 Validating JSON-LD...")
 
-        entities = jsonld["@graph"]
         errors = []
-
         for i, entity in enumerate(entities):
-            # Check required fields
-            if "@id" not in entity:
-                errors.append(f"Entity {i}: missing @id")
-            if "@type" not in entity:
-                errors.append(f"Entity {i}: missing @type")
-            if "name" not in entity:
-                errors.append(
-                    f"Entity {i} ({entity.get('@id', 'unknown')}): missing name"
-                )
+            errors.extend(self._entity_errors(i, entity))
+
+        return self._report_validation(errors)
+
+    def _entity_errors(self, i: int, entity: Dict[str, Any]) -> List[str]:
+        """Check an entity has the required fields."""
+        errors = []
+
+        if "@id" not in entity:
+            errors.append(f"Entity {i}: missing @id")
+        if "@type" not in entity:
+            errors.append(f"Entity {i}: missing @type")
+        if "name" not in entity:
+            errors.append(f"Entity {i} ({entity.get('@id', 'unknown')}): missing name")
+
+        return errors
 
+    def _report_validation(self, errors: List[str]) -> bool:
+        """Print validation results; returns True if there were no errors."""
         if errors:
             print(f"❌ Validation failed with {len(errors)} errors:")
             for error in errors[:10]:
@@ -83,70 +133,123 @@ class DgraphLoader:
         print(f"✅ Validation passed")
         return True
 
-    def analyze_schema(self, jsonld: Dict[str, Any]):
+    def analyze_schema(self, entities: Iterable[Dict[str, Any]]):
         """Analyze JSON-LD to infer Dgraph schema with mixed type detection."""
         print("🔬 Analyzing schema...")
 
-        entities = jsonld["@graph"]
-
         # Analyze entities to determine predicate types and collect entity types
         for entity in entities:
-            # Collect entity types for schema generation
-            entity_types_for_this_entity = []
-            if "@type" in entity:
-                entity_type = entity["@type"]
-                if isinstance(entity_type, list):
-                    self.entity_types.update(entity_type)
-                    entity_types_for_this_entity = entity_type
-                else:
-                    self.entity_types.add(entity_type)
-                    entity_types_for_this_entity = [entity_type]
+            self._analyze_entity(entity)
 
-            for key, value in entity.items():
-                if key in ["@id", "@type"]:
-                    continue
+        self._finish_analysis()
 
-                # Clean predicate name (strip @ prefix) to avoid duplicates
-                # Both @name and name should map to the same predicate
-                clean_key = self._encode_predicate(key)
-
-                # Track which types use this predicate (for sparse type definitions)
-                for etype in entity_types_for_this_entity:
-                    if etype not in self.type_predicates:
-                        self.type_predicates[etype] = set()
-                    self.type_predicates[etype].add(clean_key)
-
-                # Initialize tracking set if needed
-                if clean_key not in self.predicate_type_observations:
-                    self.predicate_type_observations[clean_key] = set()
-
-                # Check if it's a relationship (reference to another entity)
-                is_relationship = False
-
-                if isinstance(value, dict) and "@id" in value:
-                    is_relationship = True
-                elif isinstance(value, list):
-                    # Check all items in list to detect mixed types
-                    for item in value:
-                        if isinstance(item, dict) and "@id" in item:
-                            is_relationship = True
-                        elif item is not None:
-                            # Non-reference item in list
-                            scalar_type = self._infer_scalar_type(item)
-                            if scalar_type:  # Only add if not None
-                                self.predicate_type_observations[clean_key].add(
-                                    scalar_type
-                                )
-
-                if is_relationship:
-                    self.relationship_predicates.add(clean_key)
-                    self.predicate_type_observations[clean_key].add("uid")
-                else:
-                    # Infer and track scalar type
-                    scalar_type = self._infer_scalar_type(value)
-                    if scalar_type:  # Only add if not None (skip dicts/lists)
-                        self.predicate_type_observations[clean_key].add(scalar_type)
+    def validate_and_analyze(self, entities: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Validate entities and infer the schema in a single pass.
+
+        Equivalent to validate_jsonld() followed by analyze_schema(), but
+        reads each entity once, so a streamed graph is only parsed once.
+        Returns False (after printing the errors) if validation failed.
+        """
+        print("🔍 Validating JSON-LD and analyzing schema...")
+
+        errors = []
+        count = 0
+        if self.workers > 1:
+            # Analyze shards in worker processes and merge their observations
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                # Pair each shard with its first entity's index in the graph
+                shards = (
+                    (shard_number * SHARD_SIZE, shard)
+                    for shard_number, shard in enumerate(_shards(entities, SHARD_SIZE))
+                )
+                for shard_count, shard_errors, shard_loader in _map_in_order(
+                    executor, _analyze_shard, shards, window=self.workers * 2
+                ):
+                    count += shard_count
+                    errors.extend(shard_errors)
+                    self._merge_analysis(shard_loader)
+        else:
+            for count, entity in enumerate(entities, 1):
+                errors.extend(self._entity_errors(count - 1, entity))
+                self._analyze_entity(entity)
+
+        print(f"  Read {count} entities")
+        if not self._report_validation(errors):
+            return False
+
+        self._finish_analysis()
+        return True
+
+    def _analyze_entity(self, entity: Dict[str, Any]):
+        """Record the types and predicate value types of a single entity."""
+        # Collect entity types for schema generation
+        entity_types_for_this_entity = []
+        if "@type" in entity:
+            entity_type = entity["@type"]
+            if isinstance(entity_type, list):
+                self.entity_types.update(entity_type)
+                entity_types_for_this_entity = entity_type
+            else:
+                self.entity_types.add(entity_type)
+                entity_types_for_this_entity = [entity_type]
+
+        for key, value in entity.items():
+            if key in ["@id", "@type"]:
+                continue
+
+            # Clean predicate name (strip @ prefix) to avoid duplicates
+            # Both @name and name should map to the same predicate
+            clean_key = self._encode_predicate(key)
+
+            # Track which types use this predicate (for sparse type definitions)
+            for etype in entity_types_for_this_entity:
+                if etype not in self.type_predicates:
+                    self.type_predicates[etype] = set()
+                self.type_predicates[etype].add(clean_key)
+
+            # Initialize tracking set if needed
+            if clean_key not in self.predicate_type_observations:
+                self.predicate_type_observations[clean_key] = set()
+
+            # Check if it's a relationship (reference to another entity)
+            is_relationship = False
+
+            if isinstance(value, dict) and "@id" in value:
+                is_relationship = True
+            elif isinstance(value, list):
+                # Check all items in list to detect mixed types
+                for item in value:
+                    if isinstance(item, dict) and "@id" in item:
+                        is_relationship = True
+                    elif item is not None:
+                        # Non-reference item in list
+                        scalar_type = self._infer_scalar_type(item)
+                        if scalar_type:  # Only add if not None
+                            self.predicate_type_observations[clean_key].add(scalar_type)
+
+            if is_relationship:
+                self.relationship_predicates.add(clean_key)
+                self.predicate_type_observations[clean_key].add("uid")
+            else:
+                # Infer and track scalar type
+                scalar_type = self._infer_scalar_type(value)
+                if scalar_type:  # Only add if not None (skip dicts/lists)
+                    self.predicate_type_observations[clean_key].add(scalar_type)
+
+    def _merge_analysis(self, other: "DgraphLoader"):
+        """Fold the schema observations of another loader into this one."""
+        self.entity_types.update(other.entity_types)
+        self.relationship_predicates.update(other.relationship_predicates)
+        for etype, predicates in other.type_predicates.items():
+            self.type_predicates.setdefault(etype, set()).update(predicates)
+        for predicate, observed in other.predicate_type_observations.items():
+            self.predicate_type_observations.setdefault(predicate, set()).update(
+                observed
+            )
 
+    def _finish_analysis(self):
+        """Resolve observed predicate types and print the schema summary."""
         # Resolve mixed types
         self._resolve_predicate_types()
 
@@ -270,83 +373,107 @@ class DgraphLoader:
 
         return "\n".join(schema_lines)
 
-    def convert_to_nquads(self, jsonld: Dict[str, Any]) -> List[str]:
-        """Convert JSON-LD to N-Quads format for Dgraph."""
-        print("🔄 Converting to N-Quads...")
+    def convert_to_nquads(self, entities: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Convert JSON-LD entities to N-Quads format for Dgraph.
 
-        nquads = []
-        entities = jsonld["@graph"]
+        Yields triples as entities are converted, so the full set of N-Quads
+        is never held in memory.
+        """
+        print("🔄 Converting to N-Quads...")
 
-        for entity in entities:
-            subject = self._encode_urn(entity["@id"])
-
-            # Add dgraph.type for expand(_all_) support
-            if "@type" in entity:
-                entity_type = entity["@type"]
-                if isinstance(entity_type, list):
-                    for t in entity_type:
-                        nquads.append(f'{subject} <dgraph.type> "{t}" .')
-                else:
-                    nquads.append(f'{subject} <dgraph.type> "{entity_type}" .')
+        count = 0
+
+        if self.workers > 1:
+            # Convert shards in worker processes; results come back in order
+            convert = functools.partial(_convert_shard, self.predicate_types)
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for shard_nquads in _map_in_order(
+                    executor,
+                    convert,
+                    _shards(entities, SHARD_SIZE),
+                    window=self.workers * 2,
+                ):
+                    count += len(shard_nquads)
+                    yield from shard_nquads
+        else:
+            nquads = []
+            for entity in entities:
+                self._add_nquads(entity, nquads)
+                count += len(nquads)
+                yield from nquads
+                nquads.clear()
+
+        print(f"✅ Generated {count} triples")
+
+    def _add_nquads(self, entity: Dict[str, Any], nquads: List[str]):
+        """Append the N-Quads for a single entity."""
+        subject = self._encode_urn(entity["@id"])
+
+        # Add dgraph.type for expand(_all_) support
+        if "@type" in entity:
+            entity_type = entity["@type"]
+            if isinstance(entity_type, list):
+                for t in entity_type:
+                    nquads.append(f'{subject} <dgraph.type> "{t}" .')
+            else:
+                nquads.append(f'{subject} <dgraph.type> "{entity_type}" .')
 
-            for key, value in entity.items():
-                if key == "@id":
-                    continue
+        for key, value in entity.items():
+            if key == "@id":
+                continue
 
-                predicate = self._encode_predicate(key)
+            predicate = self._encode_predicate(key)
 
-                # Handle different value types
-                if isinstance(value, dict) and "@id" in value:
-                    # Relationship to another entity
-                    obj = self._encode_urn(value["@id"])
-                    nquads.append(f"{subject} <{predicate}> {obj} .")
+            # Handle different value types
+            if isinstance(value, dict) and "@id" in value:
+                # Relationship to another entity
+                obj = self._encode_urn(value["@id"])
+                nquads.append(f"{subject} <{predicate}> {obj} .")
 
-                elif isinstance(value, list):
-                    # Array of values
-                    for item in value:
-                        if isinstance(item, dict) and "@id" in item:
-                            obj = self._encode_urn(item["@id"])
+            elif isinstance(value, list):
+                # Array of values
+                for item in value:
+                    if isinstance(item, dict) and "@id" in item:
+                        obj = self._encode_urn(item["@id"])
+                        nquads.append(f"{subject} <{predicate}> {obj} .")
+                    elif isinstance(item, dict):
+                        # Skip nested objects if predicate is uid type
+                        if (
+                            predicate in self.predicate_types
+                            and self.predicate_types[predicate] == "uid"
+                        ):
+                            continue
+                        # Skip empty objects
+                        if not item:
+                            continue
+                        # Nested object (serialize as JSON string)
+                        obj_str = json.dumps(item).replace('"', '\\"')
+                        nquads.append(f'{subject} <{predicate}> "{obj_str}" .')
+                    else:
+                        # Skip scalars if predicate is uid type
+                        if (
+                            predicate in self.predicate_types
+                            and self.predicate_types[predicate] == "uid"
+                        ):
+                            continue
+                        obj = self._format_literal(item)
+                        if obj:  # Only add if not None
                             nquads.append(f"{subject} <{predicate}> {obj} .")
-                        elif isinstance(item, dict):
-                            # Skip nested objects if predicate is uid type
-                            if (
-                                predicate in self.predicate_types
-                                and self.predicate_types[predicate] == "uid"
-                            ):
-                                continue
-                            # Skip empty objects
-                            if not item:
-                                continue
-                            # Nested object (serialize as JSON string)
-                            obj_str = json.dumps(item).replace('"', '\\"')
-                            nquads.append(f'{subject} <{predicate}> "{obj_str}" .')
-                        else:
-                            # Skip scalars if predicate is uid type
-                            if (
-                                predicate in self.predicate_types
-                                and self.predicate_types[predicate] == "uid"
-                            ):
-                                continue
-                            obj = self._format_literal(item)
-                            if obj:  # Only add if not None
-                                nquads.append(f"{subject} <{predicate}> {obj} .")
 
-                else:
-                    # Scalar value
-                    # Skip if this predicate is defined as uid type (mixed type case)
-                    if (
-                        predicate in self.predicate_types
-                        and self.predicate_types[predicate] == "uid"
-                    ):
-                        # This predicate should only have uid values, skip scalars
-                        continue
-
-                    obj = self._format_literal(value)
-                    if obj:  # Only add if not None
-                        nquads.append(f"{subject} <{predicate}> {obj} .")
+            else:
+                # Scalar value
+                # Skip if this predicate is defined as uid type (mixed type case)
+                if (
+                    predicate in self.predicate_types
+                    and self.predicate_types[predicate] == "uid"
+                ):
+                    # This predicate should only have uid values, skip scalars
+                    continue
 
-        print(f"✅ Generated {len(nquads)} triples")
-        return nquads
+                obj = self._format_literal(value)
+                if obj:  # Only add if not None
+                    nquads.append(f"{subject} <{predicate}> {obj} .")
 
     def _encode_urn(self, urn: str) -> str:
         """Encode URN for Dgraph (handle special characters)."""
@@ -495,36 +622,39 @@ class DgraphLoader:
             print(f"❌ Network error applying schema: {e}")
             raise
 
-    def load_nquads(self, nquads: List[str], schema: str = None):
+    def load_nquads(self, nquads: Iterable[str], schema: str = None):
         """
         Load N-Quads into Dgraph using dgraph live command.
 
+        Triples are streamed into a gzipped temporary file (dgraph live reads
+        .rdf.gz directly); the API fallbacks read them back from that file.
+
         Args:
-            nquads: List of N-Quad triples to load
+            nquads: N-Quad triples to load (any iterable, e.g. a generator)
             schema: Optional schema string to pass to dgraph live (prevents auto-schema)
         """
-        print(f"📊 Loading {len(nquads)} triples into Dgraph...")
+        data_path = None
+        schema_path = None
 
-        # Filter out None values (skipped triples)
-        nquads = [nq for nq in nquads if nq is not None]
+        # Cleanup below also covers a conversion error while writing the data
+        try:
+            # Create temporary file for data
+            with tempfile.NamedTemporaryFile(
+                suffix=".rdf.gz", delete=False
+            ) as data_file:
+                data_path = data_file.name
+                total = self._write_nquads(nquads, data_file)
 
-        # Create temporary file for data
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".rdf", delete=False
-        ) as data_file:
-            data_file.write("\n".join(nquads))
-            data_path = data_file.name
+            print(f"📊 Loading {total} triples into Dgraph...")
 
-        # Create temporary file for schema (prevents dgraph live from auto-generating)
-        schema_path = None
-        if schema:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".schema", delete=False
-            ) as schema_file:
-                schema_file.write(schema)
-                schema_path = schema_file.name
+            # Create temporary file for schema (prevents dgraph live from auto-generating)
+            if schema:
+                with tempfile.NamedTemporaryFile(
+                    mode="w", suffix=".schema", delete=False
+                ) as schema_file:
+                    schema_file.write(schema)
+                    schema_path = schema_file.name
 
-        try:
             # Parse dgraph URL to get host and port
             from urllib.parse import urlparse
 
@@ -552,7 +682,7 @@ class DgraphLoader:
             # Skip dgraph live if alpha_port is not available (remote dgraph)
             if alpha_port is None:
                 print(f"  Remote dgraph detected - using HTTP API...")
-                self._load_via_http(nquads, schema=schema)
+                self._load_via_http(self._read_nquads(data_path), total, schema=schema)
                 return
             # Check if dgraph is available locally
             if subprocess.run(["which", "dgraph"], capture_output=True).returncode == 0:
@@ -582,7 +712,7 @@ class DgraphLoader:
                     "--rm",
                     "--network=host",  # Use host network to access localhost ports
                     "-v",
-                    f"{data_path}:/tmp/data.rdf:ro",
+                    f"{data_path}:/tmp/data.rdf.gz:ro",
                 ]
                 # Mount schema file if provided
                 if schema_path:
@@ -594,7 +724,7 @@ class DgraphLoader:
                         "dgraph",
                         "live",
                         "-f",
-                        "/tmp/data.rdf",
+                        "/tmp/data.rdf.gz",
                         "-a",
                         f"{host}:{alpha_port}",
                         "-z",
@@ -622,9 +752,7 @@ class DgraphLoader:
                     # Check if output contains success indicators
                     output = result.stdout + result.stderr
                     if "N-Quads processed" in output or "Number of TXs run" in output:
-                        print(
-                            f"✅ Successfully loaded {len(nquads)} triples via dgraph live"
-                        )
+                        print(f"✅ Successfully loaded {total} triples via dgraph live")
                         # Extract stats if available
                         for line in output.split("\n"):
                             if "N-Quads processed" in line or "Time spent" in line:
@@ -653,25 +781,157 @@ class DgraphLoader:
                         )
                         print("")
 
-                    print(f"  Falling back to HTTP API...")
-                    self._load_via_http(nquads, schema=schema)
+                    print(f"  Falling back to Dgraph API...")
+                    self._load_via_api(
+                        self._read_nquads(data_path),
+                        total,
+                        f"{host}:{alpha_port}",
+                        schema=schema,
+                    )
             else:
-                print(f"  No dgraph command available, using HTTP API...")
-                self._load_via_http(nquads, schema=schema)
+                print(f"  No dgraph command available, using Dgraph API...")
+                self._load_via_api(
+                    self._read_nquads(data_path),
+                    total,
+                    f"{host}:{alpha_port}",
+                    schema=schema,
+                )
 
         finally:
             # Clean up temporary files
-            try:
-                os.unlink(data_path)
-            except:
-                pass
+            if data_path:
+                try:
+                    os.unlink(data_path)
+                except:
+                    pass
             if schema_path:
                 try:
                     os.unlink(schema_path)
                 except:
                     pass
 
-    def _load_via_http(self, nquads: List[str], schema: str = None):
+    def _write_nquads(self, nquads: Iterable[str], data_file) -> int:
+        """Gzip triples into an open binary file, one per line; returns the count."""
+        total = 0
+        # Fastest compression level: the file is read once, locally
+        # newline="\n" on both ends: triples are separated by \n only, and a
+        # raw \r inside a literal must not be read back as a line break
+        with gzip.open(
+            data_file, "wt", encoding="utf-8", newline="\n", compresslevel=1
+        ) as f:
+            for nq in nquads:
+                # Skip None values (skipped triples)
+                if nq is None:
+                    continue
+                if total:
+                    f.write("\n")
+                f.write(nq)
+                total += 1
+        return total
+
+    def _read_nquads(self, data_path: str) -> Iterator[str]:
+        """Stream triples back from a file written by _write_nquads()."""
+        with gzip.open(data_path, "rt", encoding="utf-8", newline="\n") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+    def _load_via_api(
+        self,
+        nquads: Iterable[str],
+        total: int,
+        alpha_address: str,
+        schema: str = None,
+    ):
+        """Load via gRPC when pydgraph is installed, otherwise via HTTP."""
+        if pydgraph is None:
+            print(f"  💡 Tip: pip install '.[dgraph]' to load over gRPC")
+            self._load_via_http(nquads, total, schema=schema)
+        else:
+            self._load_via_grpc(nquads, total, alpha_address, schema=schema)
+
+    def _load_via_grpc(
+        self,
+        nquads: Iterable[str],
+        total: int,
+        alpha_address: str,
+        schema: str = None,
+    ):
+        """
+        Load via gRPC with concurrent transactions (requires pydgraph).
+
+        Commits small batches in parallel: each transaction is cheap to retry,
+        and concurrent commits hide the per-commit latency of the cluster.
+        Falls back to HTTP if the alpha is unreachable over gRPC.
+        """
+        stub = pydgraph.DgraphClientStub(alpha_address)
+        client = pydgraph.DgraphClient(stub)
+
+        # Probe before loading: otherwise an unreachable port fails every batch
+        try:
+            client.check_version(timeout=GRPC_CONNECT_TIMEOUT)
+        except Exception as e:
+            stub.close()
+            print(f"  ⚠️  gRPC unavailable at {alpha_address} ({e}), using HTTP API...")
+            self._load_via_http(nquads, total, schema=schema)
+            return
+
+        # Apply schema via HTTP if provided (since we're not using dgraph live)
+        if schema:
+            print(f"  📝 Applying schema via HTTP...")
+            self.apply_schema(schema)
+
+        print(
+            f"  Loading via gRPC ({alpha_address}), {GRPC_MAX_WORKERS} transactions..."
+        )
+
+        def mutate(batch: List[str]) -> int:
+            """Commit one batch; returns the number of triples loaded."""
+            rdf_data = "\n".join(batch)
+            for attempt in range(GRPC_MAX_RETRIES):
+                txn = client.txn()
+                try:
+                    txn.mutate(set_nquads=rdf_data, commit_now=True)
+                    return len(batch)
+                except pydgraph.errors.AbortedError:
+                    # Conflicted with a concurrent transaction - back off, retry.
+                    # Full jitter, so workers that conflicted together don't
+                    # all retry at the same moment
+                    if attempt < GRPC_MAX_RETRIES - 1:
+                        time.sleep(random.uniform(0, GRPC_RETRY_DELAY * 2**attempt))
+                except Exception as e:
+                    print(f"❌ Batch failed: {e}")
+                    return 0
+                finally:
+                    txn.discard()
+
+            print(f"❌ Batch aborted {GRPC_MAX_RETRIES} times, giving up")
+            return 0
+
+        total_loaded = 0
+        try:
+            with ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS) as executor:
+                for done, loaded in enumerate(
+                    _map_in_order(
+                        executor,
+                        mutate,
+                        _shards(nquads, GRPC_BATCH_SIZE),
+                        window=GRPC_MAX_WORKERS * 2,
+                    ),
+                    1,
+                ):
+                    total_loaded += loaded
+                    if done % 50 == 0:
+                        print(f"  Loaded {total_loaded}/{total} triples...")
+        finally:
+            stub.close()
+
+        print(f"  Completed gRPC loading: {total_loaded} triples")
+
+        if total_loaded < total:
+            skipped = total - total_loaded
+            print(f"⚠️  Skipped {skipped} triples ({skipped*100//total}%)")
+
+    def _load_via_http(self, nquads: Iterable[str], total: int, schema: str = None):
         """Fallback: Load via HTTP API (less reliable for bulk data)."""
         print(f"  ⚠️  Warning: HTTP API may not persist large datasets reliably")
         print(f"  💡 Tip: Use 'dgraph live' command manually for best results")
@@ -685,8 +945,8 @@ class DgraphLoader:
         BATCH_SIZE = 1000
         total_loaded = 0
 
-        for i in range(0, len(nquads), BATCH_SIZE):
-            batch = nquads[i : i + BATCH_SIZE]
+        # Batches are read from the stream one at a time
+        for batch_number, batch in enumerate(_shards(nquads, BATCH_SIZE)):
             rdf_data = "\n".join(batch)
 
             response = requests.post(
@@ -697,15 +957,15 @@ class DgraphLoader:
 
             if response.status_code == 200:
                 total_loaded += len(batch)
-                print(f"  Loaded {total_loaded}/{len(nquads)} triples...")
+                print(f"  Loaded {total_loaded}/{total} triples...")
             else:
-                print(f"❌ Batch {i} failed: {response.text}")
+                print(f"❌ Batch {batch_number * BATCH_SIZE} failed: {response.text}")
 
         print(f"  Completed HTTP loading: {total_loaded} triples")
 
-        if total_loaded < len(nquads):
-            skipped = len(nquads) - total_loaded
-            print(f"⚠️  Skipped {skipped} triples ({skipped*100//len(nquads)}%)")
+        if total_loaded < total:
+            skipped = total - total_loaded
+            print(f"⚠️  Skipped {skipped} triples ({skipped*100//total}%)")
 
     def query_stats(self):
         """Query Dgraph for statistics."""
@@ -750,14 +1010,19 @@ class DgraphLoader:
 
     def run(self, input_file: str):
         """Main execution flow."""
-        # Load and validate
-        jsonld = self.load_jsonld(input_file)
+        if ijson is None:
+            # No streaming parser: parse the document once for both passes
+            entities = self.load_jsonld(input_file)["@graph"]
+            conversion_entities = entities
+        else:
+            # Stream the file twice rather than holding the parsed document
+            print(f"📖 Streaming {input_file}...")
+            entities = self.iter_entities(input_file)
+            conversion_entities = self.iter_entities(input_file)
 
-        if not self.validate_jsonld(jsonld):
+        # Validate and analyze schema in one pass
+        if not self.validate_and_analyze(entities):
             sys.exit(1)
-
-        # Analyze schema
-        self.analyze_schema(jsonld)
         schema = self.generate_schema()
 
         # Debug: Save schema to file for inspection
@@ -770,7 +1035,7 @@ class DgraphLoader:
             self.drop_all_data()
 
         # Convert to N-Quads
-        nquads = self.convert_to_nquads(jsonld)
+        nquads = self.convert_to_nquads(conversion_entities)
 
         # Load data with schema (schema passed to dgraph live, or applied via HTTP as fallback)
         # Note: Schema is NOT applied via HTTP first because dgraph live with -s flag will handle it
@@ -782,6 +1047,66 @@ class DgraphLoader:
         print("\n✅ Load complete!")
 
 
+# Entities per task when analysis and conversion run in worker processes
+SHARD_SIZE = 2048
+
+# gRPC loading: small transactions, many in flight; aborted ones are retried
+# with jittered exponential backoff starting at GRPC_RETRY_DELAY seconds
+GRPC_BATCH_SIZE = 200
+GRPC_MAX_WORKERS = 16
+GRPC_MAX_RETRIES = 5
+GRPC_RETRY_DELAY = 0.1
+# Seconds to wait for the alpha to answer before falling back to HTTP
+GRPC_CONNECT_TIMEOUT = 5
+
+
+def _shards(items: Iterable, size: int) -> Iterator[List]:
+    """Split a stream (of entities or N-Quads) into lists of up to `size` items."""
+    it = iter(items)
+    while shard := list(itertools.islice(it, size)):
+        yield shard
+
+
+def _map_in_order(executor: Executor, fn, items: Iterable, window: int) -> Iterator:
+    """
+    Like executor.map(fn, items), but with at most `window` tasks in flight.
+
+    executor.map() submits every task up front, which would read a streamed
+    graph into memory; this reads ahead only as far as the workers need.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _analyze_shard(numbered_shard: tuple[int, List[Dict[str, Any]]]):
+    """Worker: validate and analyze a shard starting at graph index `first`."""
+    first, entities = numbered_shard
+    loader = DgraphLoader("")
+    errors = []
+    # Number entities by their position in the whole graph
+    for i, entity in enumerate(entities, first):
+        errors.extend(loader._entity_errors(i, entity))
+        loader._analyze_entity(entity)
+    return len(entities), errors, loader
+
+
+def _convert_shard(
+    predicate_types: Dict[str, str], entities: List[Dict[str, Any]]
+) -> List[str]:
+    """Worker: convert a shard to N-Quads using the resolved predicate types."""
+    loader = DgraphLoader("")
+    loader.predicate_types = predicate_types
+    nquads = []
+    for entity in entities:
+        loader._add_nquads(entity, nquads)
+    return nquads
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Load JSON-LD knowledge graph into Dgraph",
@@ -796,6 +1121,9 @@ Examples:
 
   # Load into remote Dgraph
   python load_dgraph.py --input graph.jsonld --dgraph-url http://dgraph.example.com:8080
+
+  # Analyze and convert a large graph with 4 worker processes
+  python load_dgraph.py --input graph.jsonld --workers 4
         """,
     )
 
@@ -821,6 +1149,13 @@ Examples:
         help="Dgraph Zero gRPC port (default: derived from HTTP port)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for schema analysis and N-Quad conversion (default: 1)",
+    )
+
     parser.add_argument(
         "--drop-all",
         action="store_true",
@@ -843,6 +1178,7 @@ Examples:
         args.drop_all,
         grpc_port=args.grpc_port,
         zero_port=args.zero_port,
+        workers=args.workers,
     )
     loader.run(args.input)
 
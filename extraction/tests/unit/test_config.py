@@ -115,6 +115,7 @@ def test_validation_config_defaults():
     assert config.allow_missing_name is False
     assert config.strict_urn_format is True
     assert config.fail_on_validation_errors is False
+    assert config.non_reference_keys == ["name", "description"]
 
 
 def test_llm_config_defaults():
@@ -250,3 +251,30 @@ def test_extraction_config_hash_changes_with_chunking(tmp_path: Path):
 
     # Different chunking should produce different hashes
     assert config1.compute_hash() != config2.compute_hash()
+
+
+def test_extraction_config_hash_ignores_parallel_validation(tmp_path: Path):
+    """Test config hash ignores settings that only change how validation runs."""
+    from kg_extractor.config import AuthConfig, ExtractionConfig, ValidationConfig
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+
+    config1 = ExtractionConfig(
+        data_dir=data_dir,
+        auth=AuthConfig(
+            auth_method="api_key", api_key="test"  # pragma: allowlist secret
+        ),
+    )
+    config2 = ExtractionConfig(
+        data_dir=data_dir,
+        auth=AuthConfig(
+            auth_method="api_key", api_key="test"  # pragma: allowlist secret
+        ),
+        validation=ValidationConfig(
+            parallel_validation=True, parallel_validation_threshold=1
+        ),
+    )
+
+    # Parallel validation reports the same errors, so checkpoints stay valid
+    assert config1.compute_hash() == config2.compute_hash()
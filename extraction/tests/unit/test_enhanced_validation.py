@@ -6,6 +6,7 @@ from kg_extractor.config import ValidationConfig
 from kg_extractor.models import Entity
 from kg_extractor.validation.entity_validator import (
     EntityValidator,
+    entity_urn_references,
     extract_urn_references,
 )
 from kg_extractor.validation.report import ValidationReport
@@ -31,6 +32,70 @@ def test_extract_urn_references():
     assert "urn:Tag:important" in urns
     assert "urn:Other:ref" in urns
 
+    # Deeply nested structures are walked without recursion
+    nested: dict = {"@id": "urn:Leaf:bottom"}
+    for _ in range(5000):
+        nested = {"child": [nested]}
+    assert extract_urn_references(nested) == {"urn:Leaf:bottom"}
+
+
+def test_extract_urn_references_skip_keys():
+    """Test URN extraction skips values under configured keys at any depth."""
+    value = {
+        "description": "urn:Service:mentioned-in-text",
+        "dependsOn": {"@id": "urn:Service:db", "name": "urn:Service:label"},
+    }
+
+    assert extract_urn_references(value) == {
+        "urn:Service:mentioned-in-text",
+        "urn:Service:db",
+        "urn:Service:label",
+    }
+    assert extract_urn_references(value, frozenset({"name", "description"})) == {
+        "urn:Service:db"
+    }
+
+
+def test_entity_urn_references_matches_jsonld():
+    """Test scanning an entity directly finds the URNs in its JSON-LD."""
+    entity = Entity(
+        id="urn:Service:api",
+        type="Service",
+        name="urn:Service:named",
+        description="urn:Service:described",
+        properties={
+            "dependsOn": ["urn:Service:db", [{"@id": "urn:Service:cache"}]],
+            "owner": {"name": "urn:User:label"},
+            # Shadows the core description, as in to_jsonld()
+            "description": "Plain text",
+            "empty": [None, []],
+        },
+    )
+
+    for skip_keys in (
+        frozenset(),
+        frozenset({"name"}),
+        frozenset({"name", "description"}),
+        frozenset({"@id"}),
+    ):
+        assert entity_urn_references(entity, skip_keys) == extract_urn_references(
+            entity.to_jsonld(), skip_keys
+        )
+
+
+def test_graph_validation_ignores_urns_in_free_text():
+    """Test a URN-like description is not reported as a broken reference."""
+    validator = EntityValidator(ValidationConfig(detect_orphans=False))
+
+    entity = Entity(
+        id="urn:Service:api",
+        type="Service",
+        name="API",
+        description="urn:Service:retired",
+    )
+
+    assert validator.validate_graph([entity]) == []
+
 
 def test_detect_orphaned_entities():
     """Test detection of orphaned entities (no relationships)."""
@@ -62,12 +127,12 @@ def test_detect_orphaned_entities():
     entities = [orphan, connected, db]
     errors = validator.validate_graph(entities)
 
-    # Should detect 2 orphans (orphan has no refs, db has no outgoing refs)
+    # Should detect 1 orphan (db has no outgoing refs but is referenced)
     orphan_errors = [e for e in errors if "orphaned" in e.message.lower()]
-    assert len(orphan_errors) == 2
+    assert len(orphan_errors) == 1
     orphaned_ids = {e.entity_id for e in orphan_errors}
     assert "urn:Service:orphan" in orphaned_ids
-    assert "urn:Service:db" in orphaned_ids
+    assert "urn:Service:db" not in orphaned_ids
 
 
 def test_detect_broken_references():
@@ -96,6 +161,34 @@ def test_detect_broken_references():
     assert any("urn:Service:missing" in e.message for e in broken_errors)
 
 
+def test_parallel_graph_validation_matches_sequential():
+    """Test parallel graph validation reports the same errors, in order."""
+    entities = []
+    for i in range(5000):
+        properties = {}
+        # Some entities only have incoming references, every fifth a broken one
+        if i % 3:
+            properties["dependsOn"] = {"@id": f"urn:Service:s{(i + 1) % 5000}"}
+        if i % 5 == 0:
+            properties["owner"] = {"@id": f"urn:User:u{i}"}
+        entities.append(
+            Entity(
+                id=f"urn:Service:s{i}",
+                type="Service",
+                name=f"Service {i}",
+                properties=properties,
+            )
+        )
+
+    sequential = EntityValidator(ValidationConfig()).validate_graph(entities)
+    parallel = EntityValidator(
+        ValidationConfig(parallel_validation=True, parallel_validation_threshold=1)
+    ).validate_graph(entities)
+
+    assert sequential
+    assert parallel == sequential
+
+
 def test_validation_report_summary():
     """Test validation report generation."""
     from kg_extractor.models import ValidationError
@@ -144,6 +237,35 @@ def test_validation_report_summary():
     assert "Warnings: 1" in text
 
 
+def test_validation_report_json_bytes_and_save(monkeypatch, tmp_path):
+    """Test JSON bytes export and saving match the JSON string export."""
+    import json
+    import sys
+
+    from kg_extractor.models import ValidationError
+
+    report = ValidationReport(
+        [
+            ValidationError(
+                entity_id="urn:Service:api-1",
+                field="reference",
+                message="References non-existent entity: urn:User:missing",
+                severity="error",
+            )
+        ]
+    )
+
+    assert json.loads(report.to_json_bytes()) == report.to_dict()
+    report.save(tmp_path / "report.json")
+    assert json.loads((tmp_path / "report.json").read_bytes()) == report.to_dict()
+
+    # Falls back to the stdlib encoder without orjson
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert report.to_json_bytes() == report.to_json().encode("utf-8")
+    report.save(tmp_path / "report.json")
+    assert (tmp_path / "report.json").read_text(encoding="utf-8") == report.to_json()
+
+
 def test_validation_config_flags():
     """Test validation config flags control behavior."""
     # With orphan detection disabled
@@ -0,0 +1,290 @@
+"""Unit tests for the Dgraph loader script."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+
+class AbortedError(Exception):
+    """Stand-in for pydgraph.errors.AbortedError."""
+
+
+class FakeTxn:
+    """Transaction that aborts a set number of times before committing."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def mutate(self, set_nquads, commit_now):
+        assert commit_now
+        if self.client.aborts_left:
+            self.client.aborts_left -= 1
+            raise AbortedError("conflict")
+        self.client.committed.extend(set_nquads.split("\n"))
+
+    def discard(self):
+        self.client.discarded += 1
+
+
+class FakeClient:
+    """Dgraph client recording committed triples."""
+
+    def __init__(self, aborts, reachable=True):
+        self.aborts_left = aborts
+        self.reachable = reachable
+        self.committed = []
+        self.discarded = 0
+
+    def check_version(self, timeout):
+        if not self.reachable:
+            raise ConnectionError("failed to connect to all addresses")
+        return "v23.1.1"
+
+    def txn(self):
+        assert self.reachable
+        return FakeTxn(self)
+
+
+@pytest.fixture
+def fake_pydgraph(monkeypatch):
+    """Install a fake pydgraph module and record backoff sleeps."""
+    import load_dgraph
+
+    sleeps = []
+    fake = SimpleNamespace(
+        errors=SimpleNamespace(AbortedError=AbortedError),
+        DgraphClientStub=lambda address: SimpleNamespace(close=lambda: None),
+        client=None,
+        sleeps=sleeps,
+    )
+    fake.DgraphClient = lambda stub: fake.client
+    monkeypatch.setattr(load_dgraph, "pydgraph", fake)
+    monkeypatch.setattr(load_dgraph, "GRPC_MAX_WORKERS", 1)
+    monkeypatch.setattr(load_dgraph.time, "sleep", sleeps.append)
+    return fake
+
+
+def test_load_via_grpc_retries_aborted_transactions(fake_pydgraph, capsys):
+    """Test aborted transactions are retried with jittered backoff."""
+    import load_dgraph
+
+    fake_pydgraph.client = FakeClient(aborts=2)
+    nquads = [f'<urn:Service:s{i}> <name> "s{i}" .' for i in range(3)]
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    loader._load_via_grpc(iter(nquads), len(nquads), "localhost:9080")
+
+    assert fake_pydgraph.client.committed == nquads
+    assert fake_pydgraph.client.discarded == 3
+    # Each delay is drawn from [0, base * 2**attempt]
+    assert len(fake_pydgraph.sleeps) == 2
+    for attempt, delay in enumerate(fake_pydgraph.sleeps):
+        assert 0 <= delay <= load_dgraph.GRPC_RETRY_DELAY * 2**attempt
+    assert "Completed gRPC loading: 3 triples" in capsys.readouterr().out
+
+
+def test_load_via_grpc_gives_up_after_max_retries(fake_pydgraph, capsys):
+    """Test a batch that keeps aborting is skipped after the retry limit."""
+    import load_dgraph
+
+    fake_pydgraph.client = FakeClient(aborts=load_dgraph.GRPC_MAX_RETRIES)
+    nquads = ['<urn:Service:s1> <name> "s1" .']
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    loader._load_via_grpc(iter(nquads), len(nquads), "localhost:9080")
+
+    assert fake_pydgraph.client.committed == []
+    # No backoff after the final attempt
+    assert len(fake_pydgraph.sleeps) == load_dgraph.GRPC_MAX_RETRIES - 1
+    out = capsys.readouterr().out
+    assert f"aborted {load_dgraph.GRPC_MAX_RETRIES} times, giving up" in out
+    assert "Skipped 1 triples (100%)" in out
+
+
+def test_load_via_grpc_falls_back_to_http_when_unreachable(fake_pydgraph, monkeypatch):
+    """Test an unreachable gRPC port loads via HTTP instead of failing every batch."""
+    import load_dgraph
+
+    fake_pydgraph.client = FakeClient(aborts=0, reachable=False)
+    nquads = [f'<urn:Service:s{i}> <name> "s{i}" .' for i in range(3)]
+    http_calls = []
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    monkeypatch.setattr(
+        loader,
+        "_load_via_http",
+        lambda nquads, total, schema=None: http_calls.append(
+            (list(nquads), total, schema)
+        ),
+    )
+    monkeypatch.setattr(loader, "apply_schema", lambda schema: pytest.fail())
+
+    loader._load_via_grpc(
+        iter(nquads), len(nquads), "localhost:9080", schema="name: string ."
+    )
+
+    assert http_calls == [(nquads, 3, "name: string .")]
+    assert fake_pydgraph.client.committed == []
+
+
+def test_nquads_round_trip_preserves_carriage_returns(tmp_path):
+    """Test literals containing CR/CRLF are not split when read back."""
+    import load_dgraph
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    literal = loader._format_literal("line1\r\nline2\rline3")
+    nquads = [
+        f"<urn:Service:s1> <description> {literal} .",
+        '<urn:Service:s1> <raw> "a\rb\rc" .\r',
+        '<urn:Service:s2> <name> "s2" .',
+    ]
+    data_path = tmp_path / "data.rdf.gz"
+
+    with open(data_path, "wb") as data_file:
+        total = loader._write_nquads(iter(nquads + [None]), data_file)
+
+    assert total == len(nquads)
+    assert list(loader._read_nquads(str(data_path))) == nquads
+
+
+def test_load_nquads_removes_temp_file_when_conversion_fails(monkeypatch, tmp_path):
+    """Test the data temp file is cleaned up if the triple stream raises."""
+    import load_dgraph
+
+    monkeypatch.setattr(load_dgraph.tempfile, "tempdir", str(tmp_path))
+
+    def nquads():
+        yield '<urn:Service:s1> <name> "s1" .'
+        raise ValueError("bad entity")
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    with pytest.raises(ValueError, match="bad entity"):
+        loader.load_nquads(nquads(), schema="name: string .")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _sample_graph(count):
+    """Services with mixed-type and relationship predicates."""
+    return [
+        {
+            "@id": f"urn:Service:s{i}",
+            "@type": "Service" if i % 3 else "Team",
+            "name": f"s{i}",
+            # int in some shards, string in others: merged type must be string
+            "port": i if i < 4 else f"p{i}",
+            "dependsOn": [{"@id": f"urn:Service:s{j}"} for j in range(i)][:2],
+        }
+        for i in range(count)
+    ]
+
+
+def _run_loader(load_dgraph, entities, workers):
+    """Validate, analyze and convert; returns (valid, schema, nquads)."""
+    loader = load_dgraph.DgraphLoader("http://localhost:8080", workers=workers)
+    if not loader.validate_and_analyze(iter(entities)):
+        return False, None, None
+    return True, loader.generate_schema(), list(loader.convert_to_nquads(entities))
+
+
+def test_parallel_workers_match_inline_run(monkeypatch):
+    """Test worker processes produce the same schema and N-Quads, in order."""
+    import load_dgraph
+
+    monkeypatch.setattr(load_dgraph, "SHARD_SIZE", 2)
+    entities = _sample_graph(7)
+
+    inline = _run_loader(load_dgraph, entities, workers=1)
+    parallel = _run_loader(load_dgraph, entities, workers=2)
+
+    assert inline[0] is True
+    assert parallel == inline
+    assert "port: string ." in inline[1]
+
+
+def test_parallel_workers_number_errors_across_shards(monkeypatch, capsys):
+    """Test validation errors in a later shard keep their graph-wide index."""
+    import load_dgraph
+
+    monkeypatch.setattr(load_dgraph, "SHARD_SIZE", 2)
+    entities = _sample_graph(7)
+    del entities[5]["name"]
+
+    assert _run_loader(load_dgraph, entities, workers=1)[0] is False
+    inline_out = capsys.readouterr().out
+    assert _run_loader(load_dgraph, entities, workers=2)[0] is False
+    parallel_out = capsys.readouterr().out
+
+    assert "Entity 5 (urn:Service:s5): missing name" in parallel_out
+    assert parallel_out == inline_out
+
+
+@pytest.fixture(params=["ijson", "json"])
+def streaming(request, monkeypatch):
+    """Run a test with and without ijson installed; returns the mode name."""
+    import load_dgraph
+
+    if request.param == "ijson":
+        monkeypatch.setattr(load_dgraph, "ijson", pytest.importorskip("ijson"))
+    else:
+        monkeypatch.setattr(load_dgraph, "ijson", None)
+    return request.param
+
+
+def _write_jsonld(tmp_path, document):
+    path = tmp_path / "graph.jsonld"
+    path.write_text(json.dumps(document, ensure_ascii=False))
+    return str(path)
+
+
+def test_iter_entities_matches_load_jsonld(streaming, tmp_path):
+    """Test streamed entities equal the parsed "@graph", numbers included."""
+    import load_dgraph
+
+    graph = _sample_graph(5)
+    graph[0].update(score=0.25, ratio=1e-3, active=True, owner=None, label="café")
+    # A nested "@graph" key must not be mistaken for the top-level one
+    path = _write_jsonld(
+        tmp_path,
+        {"@context": {"@vocab": "urn:"}, "meta": {"@graph": []}, "@graph": graph},
+    )
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    entities = list(loader.iter_entities(path))
+
+    assert entities == loader.load_jsonld(path)["@graph"] == graph
+    # use_float=True: no Decimal leaks into literal formatting
+    assert type(entities[0]["score"]) is float
+    assert type(entities[1]["port"]) is int
+
+
+def test_iter_entities_missing_graph_raises_on_first_item(streaming, tmp_path):
+    """Test a document without a top-level "@graph" raises ValueError lazily."""
+    import load_dgraph
+
+    path = _write_jsonld(tmp_path, {"@context": {}, "meta": {"@graph": []}})
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    entities = loader.iter_entities(path)
+
+    with pytest.raises(ValueError, match="missing '@graph' key"):
+        next(entities)
+
+
+def test_run_reads_the_graph_for_both_passes(streaming, monkeypatch, tmp_path):
+    """Test run() validates and converts every entity when streaming twice."""
+    import load_dgraph
+
+    graph = _sample_graph(5)
+    path = _write_jsonld(tmp_path, {"@graph": graph})
+    loaded = []
+
+    loader = load_dgraph.DgraphLoader("http://localhost:8080")
+    monkeypatch.setattr(
+        loader, "load_nquads", lambda nquads, schema: loaded.append(list(nquads))
+    )
+    monkeypatch.setattr(loader, "query_stats", lambda: None)
+    loader.run(path)
+
+    expected = _run_loader(load_dgraph, graph, workers=1)[2]
+    assert loaded == [expected]
@@ -94,6 +94,27 @@ def test_metrics_export_json():
     assert data["extraction"]["entities_extracted"] == 10
 
 
+def test_metrics_export_json_bytes(monkeypatch):
+    """Test JSON bytes export matches the JSON string export."""
+    import json
+    import sys
+
+    metrics = ExtractionMetrics(
+        total_chunks=2,
+        chunks_processed=2,
+        entities_extracted=10,
+        validation_errors=1,
+        duration_seconds=30.0,
+    )
+    exporter = MetricsExporter(metrics)
+
+    assert json.loads(exporter.to_json_bytes()) == exporter.to_dict()
+
+    # Falls back to the stdlib encoder without orjson
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert exporter.to_json_bytes() == exporter.to_json().encode("utf-8")
+
+
 def test_metrics_export_csv():
     """Test CSV export."""
     metrics = ExtractionMetrics(
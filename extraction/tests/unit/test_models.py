@@ -309,3 +309,19 @@ def test_extraction_metrics_zero_duration():
     )
 
     assert metrics.entities_per_second == 0.0
+
+
+def test_count_references():
+    """Test counting entity references in a property mapping."""
+    from kg_extractor.models import count_references
+
+    properties = {
+        "@type": {"@id": "urn:type:ignored"},
+        "owner": {"@id": "urn:team:backend"},
+        "dependsOn": [{"@id": "urn:service:a"}, {"@id": "urn:service:b"}, "plain"],
+        "config": {"replicas": 3},
+        "language": "Python",
+    }
+
+    assert count_references(properties) == 3
+    assert count_references({}) == 0
@@ -542,3 +542,37 @@ async def test_orchestrator_progress_callback():
         assert progress_calls[0][0] == 1  # First chunk
         assert progress_calls[1][0] == 2  # Second chunk
         assert all(call[1] == 2 for call in progress_calls)  # Total = 2
+
+
+def test_orchestrator_publishes_worker_state_snapshots(tmp_path):
+    """Test worker state updates replace the snapshot instead of mutating it."""
+    from kg_extractor.config import AuthConfig, CheckpointConfig, ExtractionConfig
+    from kg_extractor.orchestrator import ExtractionOrchestrator
+
+    config = ExtractionConfig(
+        data_dir=tmp_path,
+        auth=AuthConfig(
+            auth_method="api_key", api_key="test-key"  # pragma: allowlist secret
+        ),
+        checkpoint=CheckpointConfig(enabled=False),
+    )
+    orchestrator = ExtractionOrchestrator(
+        config=config,
+        file_system=MagicMock(),
+        chunker=MagicMock(),
+        extraction_agent=MagicMock(),
+        deduplicator=MagicMock(),
+    )
+
+    orchestrator._publish_worker_state(0, status="active", chunk_id="chunk-000")
+    active = orchestrator.get_worker_states()
+    assert orchestrator.get_worker_states() is active
+
+    orchestrator._publish_worker_state(0, status="completed", entity_count=2)
+    completed = orchestrator.get_worker_states()
+
+    assert completed is not active
+    assert active == {0: {"status": "active", "chunk_id": "chunk-000"}}
+    assert completed == {
+        0: {"status": "completed", "chunk_id": "chunk-000", "entity_count": 2}
+    }
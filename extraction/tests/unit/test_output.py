@@ -17,6 +17,19 @@ def test_jsonld_context_defaults():
     assert context.context["@vocab"] == "http://schema.org/"
 
 
+def test_jsonld_context_defaults_not_shared():
+    """Test default contexts are independent copies of the shared default."""
+    from kg_extractor.output import JSONLDContext
+    from kg_extractor.output.jsonld import DEFAULT_CONTEXT
+
+    first = JSONLDContext()
+    second = JSONLDContext()
+    first.context["custom"] = "https://custom.com/"
+
+    assert "custom" not in second.context
+    assert "custom" not in DEFAULT_CONTEXT
+
+
 def test_jsonld_context_custom():
     """Test JSONLDContext with custom values."""
     from kg_extractor.output import JSONLDContext
@@ -144,6 +157,39 @@ def test_jsonld_graph_load():
         assert graph.graph[0]["@id"] == "urn:Service:api1"
 
 
+def test_jsonld_graph_load_without_ijson(monkeypatch):
+    """Test loading graph falls back to json when ijson is unavailable."""
+    import sys
+
+    from kg_extractor.models import Entity
+    from kg_extractor.output import JSONLDGraph
+
+    monkeypatch.setitem(sys.modules, "ijson", None)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "test.jsonld"
+        graph = JSONLDGraph()
+        graph.add_entity(Entity(id="urn:Service:api1", type="Service", name="API 1"))
+        graph.save(path)
+
+        loaded = JSONLDGraph.load(path)
+
+    assert loaded.graph == graph.graph
+    assert loaded.context.context == graph.context.context
+
+
+def test_jsonld_graph_load_invalid_json():
+    """Test loading a malformed file raises JSONDecodeError."""
+    from kg_extractor.output import JSONLDGraph
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "broken.jsonld"
+        path.write_text('{"@context": {}, "@graph": [')
+
+        with pytest.raises(json.JSONDecodeError):
+            JSONLDGraph.load(path)
+
+
 def test_jsonld_graph_roundtrip():
     """Test save and load roundtrip."""
     from kg_extractor.models import Entity
@@ -233,6 +279,24 @@ def test_jsonld_graph_types_property():
     assert "User" in types
 
 
+def test_jsonld_graph_types_cache_invalidated_on_add():
+    """Test cached types reflect entities added after the first read."""
+    from kg_extractor.models import Entity
+    from kg_extractor.output import JSONLDGraph
+
+    graph = JSONLDGraph()
+    graph.add_entity(Entity(id="urn:Service:api1", type="Service", name="API 1"))
+    assert graph.types == {"Service"}
+
+    # Callers get a copy; changing it leaves the cached types intact
+    graph.types.add("Bogus")
+    graph.types.discard("Service")
+    assert graph.types == {"Service"}
+
+    graph.add_entity(Entity(id="urn:User:user1", type="User", name="User 1"))
+    assert graph.types == {"Service", "User"}
+
+
 def test_jsonld_graph_indent():
     """Test JSON-LD string indentation."""
     from kg_extractor.models import Entity
@@ -168,3 +168,71 @@ def test_file_activity_extraction():
         assert (
             display.current_file == expected_filename
         ), f"Failed for: {activity}, got: {display.current_file}"
+
+
+def test_progress_display_keeps_last_ten_activities():
+    """Test agent activity keeps only the most recent 10 entries."""
+    from kg_extractor.progress import ProgressDisplay
+
+    display = ProgressDisplay(total_chunks=5, verbose=True)
+
+    for i in range(15):
+        display.log_agent_activity(f"Step {i}", activity_type="tool")
+    display._build_activity_panel()
+
+    assert len(display.agent_activity) == 10
+    assert display.agent_activity[0].endswith("Step 5")
+    assert display.agent_activity[-1].endswith("Step 14")
+
+
+def test_progress_display_activity_panel_cached_until_new_activity():
+    """Test the agent activity panel is reused until activity changes."""
+    from kg_extractor.progress import ProgressDisplay
+
+    display = ProgressDisplay(total_chunks=5, verbose=True)
+    display.log_agent_activity("Step 1", activity_type="tool")
+
+    panel = display._build_activity_panel()
+    assert display._build_activity_panel() is panel
+
+    display.log_agent_activity("Step 2", activity_type="tool")
+    assert display._build_activity_panel() is not panel
+
+
+def test_progress_display_clears_activity_on_new_chunk():
+    """Test agent activity starts empty for each new chunk."""
+    from kg_extractor.progress import ProgressDisplay
+
+    display = ProgressDisplay(total_chunks=5, verbose=True)
+    for i in range(3):
+        display.log_agent_activity(f"Step {i}", activity_type="tool")
+
+    display.update_chunk(
+        chunk_num=2, chunk_id="chunk-002", files=[Path("/data/a.yaml")], size_mb=0.1
+    )
+
+    assert len(display.agent_activity) == 0
+    assert display.agent_activity.maxlen == 10
+    assert "Waiting for agent activity" in str(
+        display._build_activity_panel().renderable
+    )
+
+
+def test_progress_display_coalesces_activity_until_refresh():
+    """Test a burst of activities is formatted once, on the next refresh."""
+    from kg_extractor.progress import ProgressDisplay
+
+    display = ProgressDisplay(total_chunks=5, verbose=True)
+    panel = display._build_activity_panel()
+
+    display.log_agent_activity("Read", activity_type="tool", detail="a.yaml")
+    display.log_agent_activity("Planning", activity_type="thinking")
+    assert len(display.agent_activity) == 0
+
+    rebuilt = display._build_activity_panel()
+    assert rebuilt is not panel
+    assert list(display.agent_activity) == [
+        "🔧 Read [dim]a.yaml[/dim]",
+        "💭 Planning",
+    ]
+    assert display._build_activity_panel() is rebuilt
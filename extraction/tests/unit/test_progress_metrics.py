@@ -270,3 +270,391 @@ def test_file_list_display_in_chunk_info():
 
         assert display.current_chunk_info["files"] == files
         assert len(display.current_chunk_info["files"]) == 3
+
+
+def test_files_display_formatted_once_per_chunk():
+    """Test the files summary is built in update_chunk and truncated after 5."""
+    display = ProgressDisplay(total_chunks=2, verbose=True)
+    files = [Path(f"/data/file_{i}.yaml") for i in range(8)]
+
+    display.update_chunk(chunk_num=1, chunk_id="chunk-000", files=files, size_mb=0.5)
+
+    expected = ", ".join(f"file_{i}.yaml" for i in range(5)) + " ... and 3 more"
+    assert display.current_chunk_info["file_count"] == 8
+    assert display.current_chunk_info["files_display"] == expected
+    assert display._files_cell.plain == expected
+
+    display.update_chunk(
+        chunk_num=2, chunk_id="chunk-001", files=files[:2], size_mb=0.1
+    )
+    assert display._files_cell.plain == "file_0.yaml, file_1.yaml"
+
+
+def test_eta_uses_moving_average_chunk_duration(monkeypatch):
+    """Test ETA is the moving-average duration times the remaining worker batches."""
+    import kg_extractor.progress as progress_module
+
+    class FakeClock:
+        now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+    clock = FakeClock()
+    monkeypatch.setattr(progress_module, "time", clock)
+
+    display = ProgressDisplay(total_chunks=9, num_workers=2)
+    assert display._calculate_eta() is None
+
+    for chunk_num, duration in enumerate([30.0, 90.0, 60.0], start=1):
+        display.update_chunk(
+            chunk_num=chunk_num, chunk_id=f"chunk-{chunk_num}", files=[], size_mb=0.0
+        )
+        clock.now += duration
+        display.advance_chunk()
+        if chunk_num < 3:
+            # Too few samples for a stable estimate
+            assert display._calculate_eta() is None
+
+    # Average 30 -> 42 -> 45.6s; 6 chunks left over 2 workers = 3 batches
+    assert display._calculate_eta() == "~2:16"
+
+
+def test_setters_leave_redraws_to_live():
+    """Test state changes only bump the display revision instead of redrawing."""
+    from unittest.mock import MagicMock
+
+    display = ProgressDisplay(total_chunks=1, verbose=True)
+    display.live = MagicMock()
+
+    display.update_stats(validation_errors=1)
+    display.update_stats(validation_errors=1)
+    display.update_stats(validation_errors=1)
+
+    display.live.refresh.assert_not_called()
+    display.live.update.assert_not_called()
+    assert display.stats["validation_errors"] == 3
+
+    # flush redraws the latest state immediately
+    display.flush()
+    assert display.live.refresh.call_count == 1
+
+
+def test_build_display_reuses_cached_panel():
+    """Test the panel is rebuilt only after state changes."""
+    display = ProgressDisplay(total_chunks=1, verbose=True)
+
+    panel = display._build_display()
+    assert display._build_display() is panel
+
+    display.update_stats(validation_errors=1)
+    rebuilt = display._build_display()
+    assert rebuilt is not panel
+    assert display.__rich__() is rebuilt
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        lambda d: d.update_chunk(
+            chunk_num=1, chunk_id="chunk-001", files=[], size_mb=0.0
+        ),
+        lambda d: d.advance_chunk(),
+        lambda d: d.set_current_file("/data/a.yaml"),
+        lambda d: d.log_agent_activity("Step", activity_type="tool"),
+        lambda d: d.update_stats(input_tokens=10),
+    ],
+)
+def test_every_setter_invalidates_cached_panel(update):
+    """Test each setter bumps the revision so the next frame is rebuilt."""
+    display = ProgressDisplay(total_chunks=2, verbose=True)
+    panel = display._build_display()
+    revision = display._revision
+
+    update(display)
+
+    assert display._revision > revision
+    rebuilt = display._build_display()
+    assert rebuilt is not panel
+    assert display._build_display() is rebuilt
+
+
+def test_worker_panel_rebuilt_only_when_worker_state_changes(monkeypatch):
+    """Test a newly published worker states snapshot invalidates the cached panel."""
+
+    class FakeOrchestrator:
+        states = {1: {"status": "processing", "chunk_id": "chunk-001"}}
+
+        def get_worker_states(self):
+            return self.states
+
+    orchestrator = FakeOrchestrator()
+    display = ProgressDisplay(total_chunks=1, orchestrator=orchestrator)
+    monkeypatch.setattr(
+        ProgressDisplay, "_check_rate_limit_status", lambda self: (False, 0.0)
+    )
+
+    panel = display._build_display()
+    worker_panel = display._worker_panel
+    assert worker_panel is not None
+    assert display._build_display() is panel
+
+    display.update_stats(validation_errors=1)
+    rebuilt = display._build_display()
+    assert rebuilt is not panel
+    assert display._worker_panel is worker_panel
+
+    orchestrator.states = {1: {"status": "completed", "chunk_id": "chunk-001"}}
+    assert display._build_display() is not rebuilt
+    assert display._worker_panel is not worker_panel
+
+
+def test_worker_panel_shows_rate_limit_countdown(monkeypatch):
+    """Test the worker panel reports a global rate limit until it clears."""
+    import time
+
+    from kg_extractor.llm.agent_client import AgentClient
+
+    class FakeOrchestrator:
+        states = {0: {"status": "active", "chunk_id": "chunk-001"}}
+
+        def get_worker_states(self):
+            return self.states
+
+    display = ProgressDisplay(total_chunks=1, orchestrator=FakeOrchestrator())
+
+    monkeypatch.setattr(AgentClient, "_rate_limited_until", time.time() + 30)
+    limited, remaining = display._check_rate_limit_status()
+    assert limited and 0 < remaining <= 30
+    panel = display._build_display()
+    assert "RATE LIMITED" in display._worker_panel.renderable
+    # The countdown is redrawn on every frame while limited
+    assert display._build_display() is not panel
+
+    monkeypatch.setattr(AgentClient, "_rate_limited_until", None)
+    assert display._check_rate_limit_status() == (False, 0.0)
+    cleared = display._build_display()
+    assert "RATE LIMITED" not in display._worker_panel.renderable
+    assert display._build_display() is cleared
+
+
+def test_display_tables_are_reused_across_builds():
+    """Test chunk and stats tables are built once and only their cells change."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    display = ProgressDisplay(total_chunks=2, verbose=True)
+    chunk_table = display._chunk_table
+    stats_container = display._stats_container
+
+    display.update_chunk(
+        chunk_num=1, chunk_id="chunk-001", files=[Path("/data/a.yaml")], size_mb=1.5
+    )
+    display.update_stats(validation_errors=2)
+
+    console = Console(file=StringIO(), width=120, force_terminal=True)
+    console.print(display._build_display())
+    output = console.file.getvalue()
+
+    assert display._chunk_table is chunk_table
+    assert display._stats_container is stats_container
+    assert "chunk-001" in output
+    assert "1.50 MB" in output
+
+
+@pytest.mark.parametrize(
+    ("verbose", "chunk_rows", "left_rows"), [(False, 3, 3), (True, 5, 5)]
+)
+def test_display_table_rows_fixed_across_updates(verbose, chunk_rows, left_rows):
+    """Test repeated updates never add rows to the pre-built tables."""
+    display = ProgressDisplay(total_chunks=3, verbose=verbose)
+    left_stats, right_stats = (
+        column._cells[0] for column in display._stats_container.columns
+    )
+
+    for chunk_num in range(1, 4):
+        display.update_chunk(
+            chunk_num=chunk_num,
+            chunk_id=f"chunk-{chunk_num}",
+            files=[Path(f"/data/{chunk_num}.yaml")],
+            size_mb=0.5,
+        )
+        display.update_stats(validation_errors=1, cost_usd=0.01)
+        display._build_display()
+
+    assert display._chunk_table.row_count == chunk_rows
+    assert left_stats.row_count == left_rows
+    assert right_stats.row_count == 3
+
+
+def test_validation_errors_cell_reused_and_restyled():
+    """Test the validation-errors cell is one Text restyled in place."""
+    display = ProgressDisplay(total_chunks=1, verbose=False)
+    cell = display._validation_errors_cell
+
+    display._build_display()
+    assert cell.plain == "0"
+    assert cell.style == "green"
+
+    display.update_stats(validation_errors=3)
+    display._build_display()
+    assert display._validation_errors_cell is cell
+    assert cell.plain == "3"
+    assert cell.style == "red bold"
+
+
+def test_only_changed_stats_cells_are_reformatted():
+    """Test a stats change re-formats only the cells whose values changed."""
+    display = ProgressDisplay(total_chunks=1, verbose=True)
+    formatted = []
+    display._stats_cells = [
+        (key, cell, lambda value, key=key, fmt=fmt: formatted.append(key) or fmt(value))
+        for key, cell, fmt in display._stats_cells
+    ]
+
+    display._build_display()
+    assert len(formatted) == 8
+
+    formatted.clear()
+    display.update_stats(cost_usd=0.25, input_tokens=1200)
+    display._build_display()
+    assert sorted(formatted) == ["running_cost_usd", "running_input_tokens"]
+    assert display._running_cost_cell.plain == "$0.2500"
+    assert display._input_tokens_cell.plain == "1,200"
+    assert display._entities_cell.plain == "0"
+
+
+def test_empty_stats_update_keeps_cached_panel():
+    """Test an update_stats call that changes nothing doesn't force a rebuild."""
+    display = ProgressDisplay(total_chunks=1, verbose=True)
+    panel = display._build_display()
+
+    display.update_stats(entities=[], validation_errors=0)
+    assert display._build_display() is panel
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, 8),
+        ({"TMUX": "/tmp/tmux-1000/default,1,0"}, 4),
+        ({"CI": "true"}, 4),
+        ({"TERM": "screen-256color"}, 4),
+        ({"TERM": "xterm-256color"}, 8),
+        ({"CI": "true", "KG_PROGRESS_FPS": "15"}, 15),
+        ({"KG_PROGRESS_FPS": "fast"}, 8),
+        ({"KG_PROGRESS_FPS": "0"}, 8),
+    ],
+)
+def test_refresh_rate_detection(monkeypatch, env, expected):
+    """Test the default refresh rate follows the environment."""
+    for name in ("TMUX", "CI", "TERM", "KG_PROGRESS_FPS"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert ProgressDisplay(total_chunks=1).refresh_per_second == expected
+
+
+def test_refresh_rate_argument_overrides_environment(monkeypatch):
+    """Test an explicit refresh rate wins over environment detection."""
+    monkeypatch.setenv("KG_PROGRESS_FPS", "15")
+
+    assert ProgressDisplay(total_chunks=1, refresh_per_second=2).refresh_per_second == 2
+
+
+@pytest.mark.parametrize("force_terminal", [True, False])
+def test_live_frames_use_synchronized_output(force_terminal):
+    """Test terminal frames are wrapped in DEC 2026 begin/end markers."""
+    from io import StringIO
+
+    from rich.console import Console
+    from rich.text import Text
+
+    from kg_extractor.progress import SynchronizedLive
+
+    console = Console(file=StringIO(), width=40, force_terminal=force_terminal)
+    live = SynchronizedLive(Text("frame"), console=console, auto_refresh=False)
+    live.start()
+    live.refresh()
+    live.stop()
+    output = console.file.getvalue()
+
+    assert "frame" in output
+    if force_terminal:
+        assert output.count("\x1b[?2026h") == output.count("\x1b[?2026l") >= 1
+        assert output.index("\x1b[?2026h") < output.index("frame")
+    else:
+        assert "\x1b[?2026" not in output
+
+
+def test_subtitle_computed_once_from_data_dir(monkeypatch, tmp_path):
+    """Test the data directory subtitle is formatted at construction time."""
+    data_dir = tmp_path / "data" / "[services]"
+    monkeypatch.chdir(tmp_path)
+
+    display = ProgressDisplay(total_chunks=1, data_dir=data_dir)
+    assert display._subtitle.plain == str(Path("data") / "[services]")
+    assert display._build_display().subtitle is display._subtitle
+
+    # Outside cwd only the directory name is shown
+    monkeypatch.chdir(data_dir.anchor)
+    assert (
+        ProgressDisplay(total_chunks=1, data_dir=Path("rel"))._subtitle.plain == "rel"
+    )
+    assert ProgressDisplay(total_chunks=1)._subtitle is None
+
+
+def test_stop_detaches_live_display():
+    """Test stop() stops Live once and later setters don't touch it."""
+    from unittest.mock import MagicMock
+
+    display = ProgressDisplay(total_chunks=1, verbose=True)
+    live = MagicMock()
+    display.live = live
+
+    display.stop()
+    display.update_stats(validation_errors=1)
+    display.flush()
+
+    live.stop.assert_called_once()
+    live.refresh.assert_not_called()
+    assert display.live is None
+
+
+def test_print_success_summary():
+    """Test the success panel lists the final statistics."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    display = ProgressDisplay(total_chunks=3, verbose=True)
+    display.console = Console(file=StringIO(), width=80)
+    display.update_stats(validation_errors=2, cost_usd=1.5)
+
+    display.print_success(total_entities=10, total_chunks=3, duration=12.345)
+    output = display.console.file.getvalue()
+
+    assert "Extraction Complete!" in output
+    assert "Entities Extracted: 10" in output
+    assert "Validation Errors:  2" in output
+    assert "Duration:           12.35s" in output
+    assert "Total Cost:         $1.5000" in output
+
+
+def test_print_error_panel():
+    """Test the error panel is written to the console output."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    display = ProgressDisplay(total_chunks=1)
+    display.console = Console(file=StringIO(), width=80)
+
+    display.print_error("Something broke")
+    output = display.console.file.getvalue()
+
+    assert output.startswith("\n")
+    assert "Extraction Failed" in output
+    assert "Something broke" in output
@@ -241,6 +241,32 @@ def test_prompt_template_undefined_variable_error():
         template.render()
 
 
+def test_prompt_template_reuses_compiled_templates():
+    """Test PromptTemplate compiles once and recompiles after prompt changes."""
+    from kg_extractor.prompts.models import PromptMetadata, PromptTemplate
+
+    template = PromptTemplate(
+        metadata=PromptMetadata(
+            name="test",
+            version="1.0.0",
+            description="Test",
+            created="2025-01-23",
+        ),
+        variables={},
+        system_prompt="Hello, {{ name }}!",
+        user_prompt="Please respond.",
+    )
+
+    template.render(name="A")
+    compiled = template._compile()
+    assert template.render(name="B") == ("Hello, B!", "Please respond.")
+    assert template._compile() == compiled
+
+    template.system_prompt = "Bye, {{ name }}!"
+    assert template.render(name="C") == ("Bye, C!", "Please respond.")
+    assert template._compile() != compiled
+
+
 def test_prompt_template_generate_documentation():
     """Test PromptTemplate.generate_documentation()."""
     from kg_extractor.prompts.models import (
@@ -293,6 +319,11 @@ def test_prompt_template_generate_documentation():
     assert "- **Required**: No" in doc
     assert "- **Default**: `10`" in doc
 
+    # Cached until metadata or variables is reassigned
+    assert template.generate_documentation() is doc
+    template.variables = {}
+    assert "### `name`" not in template.generate_documentation()
+
 
 def test_prompt_template_list_variables():
     """Test PromptTemplate.list_variables()."""
@@ -412,6 +443,36 @@ def test_disk_prompt_loader_load_not_found():
             loader.load("nonexistent")
 
 
+def test_disk_prompt_loader_load_invalid_jinja():
+    """Test DiskPromptLoader.load() rejects templates with invalid Jinja2 syntax."""
+    from pathlib import Path
+
+    from kg_extractor.prompts.loader import DiskPromptLoader
+    from kg_extractor.prompts.models import TemplateError
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_dir = Path(tmpdir)
+        (template_dir / "broken.yaml").write_text(
+            """
+metadata:
+  name: broken
+  version: "1.0.0"
+  description: "Broken template"
+  created: "2025-01-23"
+
+system_prompt: "{% if name %}Hello"
+user_prompt: "Please respond."
+"""
+        )
+
+        loader = DiskPromptLoader(template_dir=template_dir)
+
+        with pytest.raises(TemplateError, match="Failed to load template broken"):
+            loader.load("broken")
+
+
 def test_disk_prompt_loader_list_templates():
     """Test DiskPromptLoader.list_templates()."""
     from pathlib import Path
@@ -431,12 +492,46 @@ def test_disk_prompt_loader_list_templates():
             "metadata:\n  name: template2\n  version: '1.0.0'\n  description: 'Test'\n  created: '2025-01-23'\nvariables: {}\nsystem_prompt: 'Test'\nuser_prompt: 'Test'"
         )  # pragma: allowlist secret
 
+        # Non-template files and directories are ignored
+        (template_dir / "notes.txt").write_text("not a template")
+        (template_dir / "subdir.yaml").mkdir()
+
         loader = DiskPromptLoader(template_dir=template_dir)
         templates = loader.list_templates()
 
         assert templates == ["template1", "template2"]
 
 
+def test_disk_prompt_loader_list_templates_cache():
+    """Test DiskPromptLoader.list_templates() rescans when the directory changes."""
+    import os
+    from pathlib import Path
+
+    from kg_extractor.prompts.loader import DiskPromptLoader
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_dir = Path(tmpdir)
+        (template_dir / "template1.yaml").write_text("metadata: {}")
+
+        loader = DiskPromptLoader(template_dir=template_dir)
+        templates = loader.list_templates()
+        assert templates == ["template1"]
+
+        # Returned lists are copies of the cached listing
+        templates.append("mutated")
+        assert loader.list_templates() == ["template1"]
+
+        # Adding a file changes the directory mtime; bump it explicitly so the
+        # test does not depend on filesystem timestamp resolution
+        mtime_ns = os.stat(template_dir).st_mtime_ns
+        (template_dir / "template2.yaml").write_text("metadata: {}")
+        os.utime(template_dir, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+        assert loader.list_templates() == ["template1", "template2"]
+
+
 def test_disk_prompt_loader_caching():
     """Test DiskPromptLoader caches loaded templates."""
     from pathlib import Path
@@ -489,6 +584,43 @@ user_prompt: "Test"
         assert template2.system_prompt == "Original"  # Still cached
 
 
+def test_disk_prompt_loader_concurrent_load_reads_once():
+    """Test concurrent DiskPromptLoader.load() calls read a template once."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    from kg_extractor.prompts.loader import DiskPromptLoader
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_dir = Path(tmpdir)
+        (template_dir / "test.yaml").write_text(
+            "metadata:\n  name: test\n  version: '1.0.0'\n  description: 'Test'\n  created: '2025-01-23'\nvariables: {}\nsystem_prompt: 'Test'\nuser_prompt: 'Test'"
+        )  # pragma: allowlist secret
+
+        loader = DiskPromptLoader(template_dir=template_dir)
+        load_from_disk = loader._load_from_disk
+        calls = []
+        calls_lock = threading.Lock()
+
+        def slow_load_from_disk(name):
+            with calls_lock:
+                calls.append(name)
+            time.sleep(0.05)
+            return load_from_disk(name)
+
+        loader._load_from_disk = slow_load_from_disk
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            templates = list(executor.map(loader.load, ["test"] * 8))
+
+        assert calls == ["test"]
+        assert all(template is templates[0] for template in templates)
+
+
 def test_disk_prompt_loader_reload():
     """Test DiskPromptLoader.reload() bypasses cache."""
     from pathlib import Path
@@ -577,6 +709,31 @@ user_prompt: "Test"
         assert len(loader._cache) == 0
 
 
+def test_disk_prompt_loader_generate_docs():
+    """Test DiskPromptLoader.generate_docs() writes one file per template."""
+    from pathlib import Path
+
+    from kg_extractor.prompts.loader import DiskPromptLoader
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_dir = Path(tmpdir) / "templates"
+        template_dir.mkdir()
+        for i in range(5):
+            (template_dir / f"template{i}.yaml").write_text(
+                f"metadata:\n  name: template{i}\n  version: '1.0.0'\n  description: 'Test'\n  created: '2025-01-23'\nvariables: {{}}\nsystem_prompt: 'Test'\nuser_prompt: 'Test'"
+            )  # pragma: allowlist secret
+
+        output_dir = Path(tmpdir) / "docs"
+        loader = DiskPromptLoader(template_dir=template_dir)
+        loader.generate_docs(output_dir)
+
+        for i in range(5):
+            doc = (output_dir / f"template{i}.md").read_text()
+            assert doc.startswith(f"# template{i} (v1.0.0)")
+
+
 def test_in_memory_prompt_loader_load():
     """Test InMemoryPromptLoader.load()."""
     from kg_extractor.prompts.loader import InMemoryPromptLoader
@@ -66,7 +66,7 @@ async def test_extraction_agent_renders_template(tmp_path):
 
     # Mock validator
     mock_validator = MagicMock()
-    mock_validator.validate = MagicMock(return_value=[])
+    mock_validator.validate_many = MagicMock(return_value=[])
 
     # Create extraction agent
     agent = ExtractionAgent(
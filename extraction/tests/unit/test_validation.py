@@ -302,3 +302,63 @@ def test_entity_validator_with_custom_required_fields():
     errors = validator.validate_dict(entity_dict)
     # Should detect missing required field
     assert any("description" in error.message.lower() for error in errors)
+
+
+def test_entity_validator_validate_matches_validate_dict():
+    """Test validate(entity) reports the same fields as the equivalent dict."""
+    from kg_extractor.config import ValidationConfig
+    from kg_extractor.models import Entity
+    from kg_extractor.validation.entity_validator import EntityValidator
+
+    config = ValidationConfig(
+        required_fields=["@id", "@type", "name", "description", "owner"],
+    )
+
+    validator = EntityValidator(config=config)
+
+    without_description = Entity(
+        id="urn:Service:api", type="Service", name="API", properties={}
+    )
+    errors = validator.validate(without_description)
+    assert [error.field for error in errors] == ["description", "owner"]
+
+    with_owner = Entity(
+        id="urn:Service:api",
+        type="Service",
+        name="API",
+        description="Public API",
+        properties={"owner": {"@id": "urn:Team:payments"}},
+    )
+    assert validator.validate(with_owner) == []
+
+
+def test_entity_validator_validate_many():
+    """Test validate_many concatenates per-entity validate() results."""
+    from kg_extractor.config import ValidationConfig
+    from kg_extractor.models import Entity
+    from kg_extractor.validation.entity_validator import EntityValidator
+
+    validator = EntityValidator(
+        config=ValidationConfig(required_fields=["@id", "@type", "name", "owner"])
+    )
+
+    entities = [
+        Entity(id="urn:Service:api1", type="Service", name="API 1"),
+        Entity(
+            id="urn:Service:api2",
+            type="Service",
+            name="API 2",
+            properties={"owner": "payments"},
+        ),
+        Entity(id="urn:Service:api3", type="Service", name="API 3"),
+    ]
+
+    errors = validator.validate_many(entities)
+
+    expected = [error for entity in entities for error in validator.validate(entity)]
+    assert errors == expected
+    assert [error.entity_id for error in errors] == [
+        "urn:Service:api1",
+        "urn:Service:api3",
+    ]
+    assert validator.validate_many([]) == []